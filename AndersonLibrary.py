@@ -2,7 +2,7 @@
 # Path: AndersonLibrary.py
 # Standard: AIDEV-PascalCase-1.8
 # Created: 2025-07-06
-# Last Modified: 2025-07-06  12:15PM
+# Last Modified: 2026-10-17  03:24PM
 """
 Description: Anderson's Library Entry Point - Original Pattern (Fixed)
 Follows the exact pattern from Legacy/Andy.py to prevent system lockups.
@@ -11,6 +11,7 @@ Follows the exact pattern from Legacy/Andy.py to prevent system lockups.
 import sys
 import logging
 import os
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Optional
 
@@ -22,9 +23,12 @@ SourcePath = Path(__file__).parent / "Source"
 if str(SourcePath) not in sys.path:
     sys.path.insert(0, str(SourcePath))
 
+# Application-wide stylesheet, applied once to the QApplication
+StyleSheetPath = Path(__file__).parent / "Assets" / "AndersonLibrary.qss"
+
 try:
     from PySide6.QtWidgets import QApplication, QMessageBox
-    from PySide6.QtCore import Qt
+    from PySide6.QtCore import Qt, QFile, QThreadPool
     from PySide6.QtGui import QFont, QIcon
 except ImportError as ImportError:
     print("❌ PySide6 is not installed!")
@@ -114,6 +118,11 @@ def ValidateEnvironment() -> bool:
 
 def InitializeLogging() -> None:
     """Initialize application logging"""
+    # Already configured (e.g. a second launch in the same process); keep the
+    # existing handlers rather than opening another log file handle
+    if logging.getLogger().handlers:
+        return
+    
     # Create logs directory if it doesn't exist
     LogsDir = Path("Logs")
     LogsDir.mkdir(exist_ok=True)
@@ -129,6 +138,28 @@ def InitializeLogging() -> None:
     )
 
 
+def StartDatabaseOpen() -> "Future[DatabaseManager]":
+    """
+    Open the library database on Qt's thread pool.
+    
+    Lets the SQLite open, pragmas and schema check overlap with QApplication
+    and widget setup; MainWindow waits on the returned future when it needs it.
+    
+    Returns:
+        Future resolving to the connected DatabaseManager
+    """
+    DatabaseFuture: "Future[DatabaseManager]" = Future()
+    
+    def OpenDatabase() -> None:
+        try:
+            DatabaseFuture.set_result(DatabaseManager.Instance(MainWindow.DatabasePath))
+        except Exception as Error:
+            DatabaseFuture.set_exception(Error)
+    
+    QThreadPool.globalInstance().start(OpenDatabase)
+    return DatabaseFuture
+
+
 def RunApplicationOriginalPattern() -> int:
     """
     Run Anderson's Library using the exact original pattern from Legacy/Andy.py.
@@ -159,14 +190,26 @@ def RunApplicationOriginalPattern() -> int:
         App.setApplicationVersion("2.0")
         App.setOrganizationName("Project Himalaya")
         App.setOrganizationDomain("BowersWorld.com")
-        AppIconPath = Path(__file__).parent / "Assets" / "icon.png"
-        AppIcon = QIcon(str(AppIconPath))
+        
+        # Start opening the database while the rest of the UI is prepared
+        DatabaseFuture = StartDatabaseOpen()
+        # Prefer an installed theme icon; Assets/ is searched as the fallback location
+        AssetsPath = Path(__file__).parent / "Assets"
+        AppIconPath = AssetsPath / "icon.png"
+        QIcon.setFallbackSearchPaths(QIcon.fallbackSearchPaths() + [str(AssetsPath)])
+        AppIcon = QIcon.fromTheme("anderson-library", QIcon(str(AppIconPath)))
         if AppIcon.isNull():
             Logger.warning(f"Failed to load application icon from {AppIconPath}")
+        # Set once on the application; every window and dialog inherits it
         App.setWindowIcon(AppIcon)
         
-        # Apply the original stylesheet (exactly like Legacy/Andy.py)
-        
+        # Apply the application stylesheet once so every window inherits it
+        StyleSheetFile = QFile(str(StyleSheetPath))
+        if StyleSheetFile.open(QFile.ReadOnly | QFile.Text):
+            App.setStyleSheet(bytes(StyleSheetFile.readAll()).decode("utf-8"))
+            StyleSheetFile.close()
+        else:
+            Logger.warning(f"Failed to load application stylesheet from {StyleSheetPath}")
         
         try:
             # Follow the EXACT original pattern from Legacy/Andy.py:
@@ -175,11 +218,10 @@ def RunApplicationOriginalPattern() -> int:
             # window.showMaximized()
             
             Logger.info("Creating main window...")
-            MainWindowInstance = MainWindow()
+            MainWindowInstance = MainWindow(DatabaseFuture)
             
             Logger.info("Showing maximized...")
             MainWindowInstance.showMaximized()
-            MainWindowInstance.setWindowIcon(AppIcon)
             
             Logger.info("Anderson's Library started successfully")
             
@@ -2,27 +2,45 @@
 # Path: Source/Core/BookService.py
 # Standard: AIDEV-PascalCase-1.8
 # Created: 2025-07-06
-# Last Modified: 2025-07-06  09:45AM
+# Last Modified: 2026-10-17  03:57PM
 """
 Description: COMPLETE FIX - Book Service with All Missing Methods
 Added missing GetSubjectsForCategory method and fixed all compatibility issues.
 """
 
 import logging
-import subprocess
-import platform
+import sys
 import os
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict, defaultdict
+from functools import singledispatchmethod
+from typing import TYPE_CHECKING, List, Optional, Dict, DefaultDict, Any, Tuple
 from pathlib import Path
 
 from Source.Core.DatabaseManager import DatabaseManager
+# Needed only by the SearchByCriteria annotation; callers build the criteria
+if TYPE_CHECKING:
+    from Source.Data.DatabaseModels import SearchCriteria
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class BookService:
     """
     COMPLETE FIX - Business logic service with all required methods for new relational schema.
+    
+    Almost everything here is a read; the one write (last-opened stamps) is
+    queued and flushed in batches. That relies on the connection tuning in
+    DatabaseManager (WAL, synchronous=NORMAL, mmap, 64 MB page cache), which
+    lets the flush run while background readers keep querying.
     """
     
+    # Most book paths remembered as existing (least recently used are dropped)
+    PathCacheSize = 4096
+    # Most title lookups remembered by GetBookDetails when the book list is not loaded
+    BookDetailsCacheSize = 512
+    # Most recent SearchByCriteria results kept (typeahead repeats the same criteria)
+    SearchCacheSize = 64
+    
     def __init__(self, DatabaseManager: DatabaseManager):
         """
         Initialize book service with database connection.
@@ -31,26 +49,67 @@ class BookService:
             DatabaseManager: Database connection manager
         """
         self.DatabaseManager = DatabaseManager
-        self.Logger = logging.getLogger(__name__)
+        self.Logger = _LOGGER
         
         # Cache for performance
-        self._CategoryCache: Optional[List[str]] = None
+        # Category/subject names, all filled together by _WarmCaches()
+        self._CategoryCache: Optional[Tuple[str, ...]] = None  # Immutable; callers get list copies
         self._SubjectCache: Optional[List[str]] = None
         self._CategorySubjectCache: Optional[Dict[str, List[str]]] = None
         
+        # Full title-ordered book list, filled by the first unpaged GetAllBooks()
+        self._AllBooksCache: Optional[List[Dict[str, Any]]] = None
+        self._BooksById: Dict[int, Dict[str, Any]] = {}
+        self._BooksByTitle: Dict[str, Dict[str, Any]] = {}
+        
+        # Paths already confirmed to exist this session (avoids re-stat on network drives)
+        self._PathExistCache: "OrderedDict[str, bool]" = OrderedDict()
+        
+        # Title -> book found by GetBookDetails' search (least recently used dropped)
+        self._BookDetailsCache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
+        # Criteria signature -> SearchByCriteria result (least recently used dropped)
+        self._SearchCache: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+        
+        # Resolve the platform's PDF opener once; None means os.startfile (Windows)
+        self._Opener: Optional[Tuple[str, ...]] = {
+            'darwin': ('open',),
+            'win32': None,
+        }.get(sys.platform, ('xdg-open',))
+        
         self.Logger.info("BookService initialized with complete method support")
     
-    def GetAllBooks(self) -> List[Dict[str, Any]]:
+    def GetAllBooks(self, Limit: Optional[int] = None, Offset: int = 0) -> List[Dict[str, Any]]:
         """
         Get all books from database using new schema.
         
+        Args:
+            Limit: Maximum number of books to return (None for all)
+            Offset: Number of books to skip, in title order
+            
         Returns:
             List of all Book dictionaries
         """
         try:
-            Books = self.DatabaseManager.GetBooks()
-            self.Logger.debug(f"Retrieved {len(Books)} books using new schema")
-            return Books
+            if self._AllBooksCache is None:
+                if Limit is not None:
+                    # Not cached yet; fetch just the requested page
+                    return self.DatabaseManager.GetBooks(Limit=Limit, Offset=Offset)
+                
+                Books = self.DatabaseManager.GetBooks()
+                if Books:
+                    self._AllBooksCache = Books
+                    self._BooksById = {Book['id']: Book for Book in Books}
+                    self._BooksByTitle = {}
+                    for Book in Books:
+                        # First in title order wins, matching the search fallback
+                        self._BooksByTitle.setdefault(Book['Title'], Book)
+                self.Logger.debug(f"Retrieved {len(Books)} books using new schema")
+                return Books.copy()
+            
+            if Limit is not None:
+                return self._AllBooksCache[Offset:Offset + Limit]
+            return self._AllBooksCache.copy()
             
         except Exception as Error:
             self.Logger.error(f"Failed to get all books: {Error}")
@@ -75,6 +134,89 @@ class BookService:
             self.Logger.error(f"Failed to search books: {Error}")
             return []
     
+    def SearchByCriteria(self, Criteria: "SearchCriteria") -> List[Dict[str, Any]]:
+        """
+        Search books with several filters at once.
+        
+        Args:
+            Criteria: Search criteria; every listed author, category and subject
+                is matched, not just the first
+            
+        Returns:
+            List of matching Book dictionaries
+        """
+        try:
+            Key = (
+                Criteria.SearchTerm,
+                tuple(Criteria.Categories or ()),
+                tuple(Criteria.Subjects or ()),
+                tuple(Criteria.Authors or ()),
+                Criteria.MinRating,
+                Criteria.MaxRating,
+                Criteria.SortBy,
+                Criteria.SortOrder,
+                Criteria.Limit,
+                Criteria.Offset,
+            )
+            Books = self._SearchCache.get(Key)
+            if Books is not None:
+                self._SearchCache.move_to_end(Key)
+                return Books.copy()
+            
+            Books = self.DatabaseManager.SearchBooks(Criteria)
+            self.Logger.debug(f"Criteria search ({Criteria.GetDescription()}) returned {len(Books)} books")
+            
+            self._SearchCache[Key] = Books
+            if len(self._SearchCache) > self.SearchCacheSize:
+                self._SearchCache.popitem(last=False)
+            return Books.copy()
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to search books by criteria: {Error}")
+            return []
+    
+    def SearchBooksPrefix(self, Prefix: str, Limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get books whose titles start with a prefix, for type-ahead completion.
+        
+        Unlike SearchBooks this is case-sensitive and anchored at the start of
+        the title, which lets it read a range of the title index.
+        
+        Args:
+            Prefix: Leading characters of the title
+            Limit: Maximum number of books to return (None for all)
+            
+        Returns:
+            List of matching Book dictionaries in title order
+        """
+        try:
+            Books = self.DatabaseManager.GetBooks(TitlePrefix=Prefix, Limit=Limit)
+            self.Logger.debug(f"Prefix search for '{Prefix}' returned {len(Books)} books")
+            return Books
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to search books by prefix: {Error}")
+            return []
+    
+    def GetBooksByIds(self, BookIds) -> List[Dict[str, Any]]:
+        """
+        Get the books with the given ids, e.g. ids resolved from a filter index.
+        
+        Args:
+            BookIds: Iterable of book ids
+            
+        Returns:
+            Matching Book dictionaries in title order
+        """
+        try:
+            Books = self.DatabaseManager.GetBooksByIds(BookIds)
+            self.Logger.debug(f"Id lookup returned {len(Books)} books")
+            return Books
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to get books by id: {Error}")
+            return []
+    
     def GetBooksByFilters(self, Category: str = "", Subject: str = "") -> List[Dict[str, Any]]:
         """
         Get books filtered by category and/or subject using new schema.
@@ -103,10 +245,10 @@ class BookService:
             List of category names
         """
         try:
-            if self._CategoryCache is None:
-                self._CategoryCache = self.DatabaseManager.GetCategories()
+            if self._CategorySubjectCache is None:
+                self._WarmCaches()
             
-            return self._CategoryCache.copy()
+            return list(self._CategoryCache)
             
         except Exception as Error:
             self.Logger.error(f"Failed to get categories: {Error}")
@@ -123,13 +265,32 @@ class BookService:
             List of subject names
         """
         try:
-            Subjects = self.DatabaseManager.GetSubjects(Category)
-            return Subjects
+            if self._CategorySubjectCache is None:
+                self._WarmCaches()
+            
+            if Category and Category != "All Categories":
+                return list(self._CategorySubjectCache.get(Category, ()))
+            return list(self._SubjectCache)
             
         except Exception as Error:
             self.Logger.error(f"Failed to get subjects: {Error}")
             return []
     
+    def _WarmCaches(self) -> None:
+        """Fill the category, subject and category -> subjects caches from one query."""
+        CategorySubjects: DefaultDict[str, List[str]] = defaultdict(list)
+        AllSubjects = set()
+        for Category, Subject in self.DatabaseManager.GetCategorySubjectPairs():
+            Subjects = CategorySubjects[Category]  # Created even for a category with no subjects
+            if Subject is not None:
+                Subjects.append(Subject)
+                AllSubjects.add(Subject)
+        
+        # Pairs arrive sorted by category then subject, so only the union needs sorting
+        self._CategoryCache = tuple(CategorySubjects)
+        self._SubjectCache = sorted(AllSubjects)
+        self._CategorySubjectCache = dict(CategorySubjects)
+    
     def GetSubjectsForCategory(self, Category: str) -> List[str]:
         """
         ADDED: Missing method that was causing errors.
@@ -162,74 +323,180 @@ class BookService:
             True if successful, False otherwise
         """
         try:
-            BookData = None
+            BookData = self.ResolveBookFile(BookIdentifier)
+            if not BookData:
+                return False
             
-            if isinstance(BookIdentifier, str):
-                # Search by title
-                Books = self.DatabaseManager.GetBooks(SearchTerm=BookIdentifier)
-                
-                if not Books:
-                    self.Logger.warning(f"Book not found: {BookIdentifier}")
-                    return False
-                
-                # Find exact match by title
-                for Book in Books:
-                    if Book.get('Title', '') == BookIdentifier:
-                        BookData = Book
-                        break
-                
-                if not BookData:
-                    # Use first result if no exact match
-                    BookData = Books[0]
-                    
-            elif isinstance(BookIdentifier, int):
-                # Search by ID
-                Books = self.DatabaseManager.GetBooks()
-                
-                for Book in Books:
-                    if Book.get('ID', 0) == BookIdentifier:
-                        BookData = Book
-                        break
-                
-                if not BookData:
-                    self.Logger.warning(f"Book not found with ID: {BookIdentifier}")
-                    return False
-            else:
-                self.Logger.error(f"Invalid book identifier type: {type(BookIdentifier)}")
+            if not self.LaunchFile(BookData['FilePath']):
                 return False
             
+            self.MarkOpened(BookData)
+            self.Logger.info(f"Successfully opened book: {BookData.get('Title', 'Unknown')}")
+            return True
+            
+        except Exception as Error:
+            self.Logger.error(f"Error opening book '{BookIdentifier}': {Error}")
+            return False
+    
+    def ResolveBookFile(self, BookIdentifier) -> Optional[Dict[str, Any]]:
+        """
+        Find a book and confirm its PDF exists, without opening it.
+        
+        Args:
+            BookIdentifier: Title (str) or ID (int) of book to open
+            
+        Returns:
+            Book dictionary with a valid FilePath, or None
+        """
+        try:
+            BookData = self._FindBook(BookIdentifier)
+            if not BookData:
+                return None
+            
             FilePath = BookData.get('FilePath', '')
             BookTitle = BookData.get('Title', 'Unknown')
             
             if not FilePath:
                 self.Logger.warning(f"No file path for book: {BookTitle}")
-                return False
+                return None
             
-            if not os.path.exists(FilePath):
+            if not self._PathExists(FilePath):
                 self.Logger.warning(f"File does not exist: {FilePath}")
-                return False
+                return None
             
-            # Open PDF with system default application
-            if platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', FilePath], check=True)
-            elif platform.system() == 'Windows':  # Windows
-                os.startfile(FilePath)
-            else:  # Linux/Unix
-                subprocess.run(['xdg-open', FilePath], check=True)
+            return BookData
             
-            # Update last opened timestamp
-            self.DatabaseManager.UpdateLastOpened(BookTitle)
+        except Exception as Error:
+            self.Logger.error(f"Error resolving book '{BookIdentifier}': {Error}")
+            return None
+    
+    @singledispatchmethod
+    def _FindBook(self, BookIdentifier) -> Optional[Dict[str, Any]]:
+        """Look up a book by identifier; dispatched on the identifier's type."""
+        self.Logger.error(f"Invalid book identifier type: {type(BookIdentifier)}")
+        return None
+    
+    @_FindBook.register
+    def _(self, BookIdentifier: str) -> Optional[Dict[str, Any]]:
+        # Exact title hit in the cached book list, then by exact title in the database
+        BookData = self._BooksByTitle.get(BookIdentifier) or self.DatabaseManager.GetBookFile(BookIdentifier)
+        if BookData:
+            return BookData
+        
+        # Search by title
+        Books = self.DatabaseManager.GetBooks(SearchTerm=BookIdentifier)
+        
+        if not Books:
+            self.Logger.warning(f"Book not found: {BookIdentifier}")
+            return None
+        
+        # Find exact match by title, else use first result
+        for Book in Books:
+            if Book.get('Title', '') == BookIdentifier:
+                return Book
+        return Books[0]
+    
+    @_FindBook.register
+    def _(self, BookIdentifier: int) -> Optional[Dict[str, Any]]:
+        # Cached book list first, then a primary-key lookup of just the file path
+        BookData = self._BooksById.get(BookIdentifier) or self.DatabaseManager.GetBookFile(BookIdentifier)
+        
+        if not BookData:
+            self.Logger.warning(f"Book not found with ID: {BookIdentifier}")
+        return BookData
+    
+    def LaunchFile(self, FilePath: str) -> bool:
+        """
+        Open a file with the platform's default application.
+        
+        Args:
+            FilePath: Path of the file to open
             
-            self.Logger.info(f"Successfully opened book: {BookTitle}")
+        Returns:
+            True if the viewer was launched
+        """
+        try:
+            if self._Opener is None:  # Windows
+                os.startfile(FilePath)
+            else:  # macOS / Linux / Unix
+                # Imported lazily: keeps subprocess out of startup until a book is opened
+                import subprocess
+                
+                # Detached launch: returns immediately, never waits on the viewer
+                subprocess.Popen(
+                    [*self._Opener, FilePath],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                    close_fds=True
+                )
             return True
             
-        except subprocess.CalledProcessError as Error:
-            self.Logger.error(f"Failed to open book '{BookIdentifier}': {Error}")
-            return False
-        except Exception as Error:
-            self.Logger.error(f"Error opening book '{BookIdentifier}': {Error}")
+        except OSError as Error:
+            # The cached existence check may be stale; re-stat on the next attempt
+            self._PathExistCache.pop(FilePath, None)
+            self.Logger.error(f"Failed to open file '{FilePath}': {Error}")
             return False
     
+    def MarkOpened(self, BookData: Dict[str, Any]) -> None:
+        """
+        Record that a book was opened.
+        
+        Args:
+            BookData: Book dictionary of the opened book
+        """
+        # Update last opened timestamp (queued; written by FlushLastOpened)
+        BookId = BookData.get('id')
+        if BookId is not None:
+            Timestamp = self.DatabaseManager.QueueLastOpened(BookId)
+            
+            # Keep the cached record current instead of dropping the cache
+            CachedBook = self._BooksById.get(BookId)
+            if CachedBook is not None:
+                CachedBook['LastOpened'] = Timestamp
+            # Copies found by GetBookDetails' search are separate dicts
+            for CachedBook in self._BookDetailsCache.values():
+                if CachedBook.get('id') == BookId:
+                    CachedBook['LastOpened'] = Timestamp
+            # Too many result lists to patch in place; opens are rare, so drop them
+            self._SearchCache.clear()
+        else:
+            self.DatabaseManager.UpdateLastOpened(BookData.get('Title', ''))
+    
+    def _PathExists(self, FilePath: str) -> bool:
+        """
+        Check whether a book file exists, remembering positive results.
+        
+        Only hits are cached so a file that appears later is still found.
+        
+        Args:
+            FilePath: Path of the book file
+            
+        Returns:
+            True if the path exists and is a regular file
+        """
+        if FilePath in self._PathExistCache:
+            self._PathExistCache.move_to_end(FilePath)
+            return True
+        
+        # Same single stat() as exists(), but a directory is not an openable book
+        Exists = os.path.isfile(FilePath)
+        if Exists:
+            self._PathExistCache[FilePath] = True
+            if len(self._PathExistCache) > self.PathCacheSize:
+                self._PathExistCache.popitem(last=False)
+        return Exists
+    
+    def FlushLastOpened(self) -> int:
+        """
+        Write queued last-opened timestamps to the database.
+        
+        Returns:
+            Number of books updated
+        """
+        return self.DatabaseManager.FlushLastOpened()
+    
     def GetBookDetails(self, BookTitle: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a specific book.
@@ -241,15 +508,26 @@ class BookService:
             Book dictionary or None if not found
         """
         try:
+            CachedBook = self._BooksByTitle.get(BookTitle)
+            if CachedBook is not None:
+                return CachedBook
+            
+            CachedBook = self._BookDetailsCache.get(BookTitle)
+            if CachedBook is not None:
+                self._BookDetailsCache.move_to_end(BookTitle)
+                return CachedBook
+            
             Books = self.DatabaseManager.GetBooks(SearchTerm=BookTitle)
+            if not Books:
+                return None
             
-            # Find exact match
-            for Book in Books:
-                if Book.get('Title', '') == BookTitle:
-                    return Book
+            # Exact title match, else the first search result
+            Book = next((Book for Book in Books if Book.get('Title', '') == BookTitle), Books[0])
             
-            # Return first match if no exact match
-            return Books[0] if Books else None
+            self._BookDetailsCache[BookTitle] = Book
+            if len(self._BookDetailsCache) > self.BookDetailsCacheSize:
+                self._BookDetailsCache.popitem(last=False)
+            return Book
             
         except Exception as Error:
             self.Logger.error(f"Failed to get book details: {Error}")
@@ -273,6 +551,12 @@ class BookService:
         self._CategoryCache = None
         self._SubjectCache = None
         self._CategorySubjectCache = None
+        self._AllBooksCache = None
+        self._BooksById = {}
+        self._BooksByTitle = {}
+        self._PathExistCache.clear()
+        self._BookDetailsCache.clear()
+        self._SearchCache.clear()
         self.Logger.info("BookService caches cleared")
     
     # ADDITIONAL COMPATIBILITY METHODS
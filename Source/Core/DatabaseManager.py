@@ -2,7 +2,7 @@
 # Path: Source/Core/DatabaseManager.py
 # Standard: AIDEV-PascalCase-1.8
 # Created: 2025-07-06
-# Last Modified: 2025-07-06  08:55AM
+# Last Modified: 2026-10-17  03:56PM
 """
 Description: NEW SCHEMA - Database Manager for Relational Schema with BLOB Thumbnails
 Updated for the new relational schema with category_id/subject_id and BLOB thumbnails.
@@ -11,10 +11,172 @@ Perfect for future web/mobile deployment!
 
 import sqlite3
 import logging
+import re
+import threading
+import weakref
+from functools import lru_cache
+from collections import OrderedDict, defaultdict
+from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Tuple, Dict, DefaultDict, Any, Optional, Iterable, Iterator
 import os
 
+# Annotation only: importing DatabaseModels at runtime would put it (and
+# dataclasses/inspect) back on the startup import path
+if TYPE_CHECKING:
+    from Source.Data.DatabaseModels import SearchCriteria
+
+_LOGGER = logging.getLogger("DatabaseManager")
+
+
+# Shared SELECT/JOIN prefix for every query that returns full book rows
+_BOOK_SELECT = """
+    SELECT b.id, b.title, b.author, b.FilePath, b.ThumbnailImage,
+           c.category as Category, s.subject as Subject,
+           b.last_opened, b.Rating, b.Notes
+    FROM books b
+    LEFT JOIN categories c ON b.category_id = c.id
+    LEFT JOIN subjects s ON b.subject_id = s.id
+"""
+
+# Fixed statements, kept as module constants so every call passes the identical
+# SQL text and hits sqlite3's per-connection prepared statement cache
+_BOOK_BY_ID_QUERY = _BOOK_SELECT + " WHERE b.id = ? LIMIT 1"
+
+# Ids per GetBooksByIds statement, well under SQLite's bound-parameter limit
+_ID_BATCH_SIZE = 500
+
+# Opening a book needs only its file path: no joins, no thumbnail BLOB
+_BOOK_FILE_BY_ID_QUERY = "SELECT id, title, FilePath FROM books WHERE id = ? LIMIT 1"
+_BOOK_FILE_BY_TITLE_QUERY = "SELECT id, title, FilePath FROM books WHERE title = ? LIMIT 1"
+
+# LEFT JOINs as in _BOOK_SELECT: books without a (valid) category or subject
+# are keyed under '' so "all subjects" / "all categories" lookups still see them
+_CATEGORY_SUBJECT_INDEX_QUERY = """
+    SELECT COALESCE(c.category, ''), COALESCE(s.subject, ''), b.id
+    FROM books b
+    LEFT JOIN categories c ON b.category_id = c.id
+    LEFT JOIN subjects s ON b.subject_id = s.id
+    ORDER BY b.title
+"""
+
+# Name lists skip NULL/blank names in SQL (NULL <> '' is not true either)
+_CATEGORIES_QUERY = "SELECT category FROM categories WHERE category <> '' ORDER BY category"
+
+_CATEGORY_SUBJECTS_QUERY = """
+    SELECT DISTINCT s.subject
+    FROM subjects s
+    JOIN categories c ON s.category_id = c.id
+    WHERE c.category = ? AND s.subject <> ''
+    ORDER BY s.subject
+"""
+
+_ALL_SUBJECTS_QUERY = "SELECT DISTINCT subject FROM subjects WHERE subject <> '' ORDER BY subject"
+
+# Every category with each of its subjects (NULL for a category without any);
+# DISTINCT as in _CATEGORY_SUBJECTS_QUERY, since a subject name can repeat
+_CATEGORY_SUBJECT_PAIRS_QUERY = """
+    SELECT DISTINCT c.category, s.subject
+    FROM categories c
+    LEFT JOIN subjects s ON s.category_id = c.id AND s.subject <> ''
+    WHERE c.category <> ''
+    ORDER BY c.category, s.subject
+"""
+
+_DATABASE_STATS_QUERY = """
+    SELECT (SELECT COUNT(*) FROM categories),
+           (SELECT COUNT(*) FROM subjects),
+           (SELECT COUNT(*) FROM books)
+"""
+
+_THUMBNAIL_QUERY = "SELECT ThumbnailImage FROM books WHERE id = ?"
+
+_UPDATE_LAST_OPENED_BY_TITLE = "UPDATE books SET last_opened = ? WHERE title = ?"
+_UPDATE_LAST_OPENED_BY_ID = "UPDATE books SET last_opened = ? WHERE id = ?"
+
+# Table count and whether planner statistics exist, checked once on Connect()
+_SCHEMA_PROBE_QUERY = """
+    SELECT COUNT(*), COALESCE(MAX(name = 'sqlite_stat1'), 0)
+    FROM sqlite_master
+    WHERE type = 'table'
+"""
+
+# Indexes for subject filters: subject name -> subject ids -> books in title order
+_SUPPORTING_INDEXES = (
+    ("idx_subjects_subject", "CREATE INDEX IF NOT EXISTS idx_subjects_subject ON subjects (subject)"),
+    ("idx_books_subject_title", "CREATE INDEX IF NOT EXISTS idx_books_subject_title ON books (subject_id, title)"),
+)
+
+# Trigram full-text index over title/author, so substring searches become
+# index lookups instead of a LIKE scan; triggers keep it in step with books
+_SEARCH_INDEX_STATEMENTS = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5(
+           title, author, content='books', content_rowid='id', tokenize='trigram'
+       )""",
+    """CREATE TRIGGER IF NOT EXISTS books_fts_insert AFTER INSERT ON books BEGIN
+           INSERT INTO books_fts(rowid, title, author) VALUES (new.id, new.title, new.author);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS books_fts_delete AFTER DELETE ON books BEGIN
+           INSERT INTO books_fts(books_fts, rowid, title, author)
+           VALUES ('delete', old.id, old.title, old.author);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS books_fts_update AFTER UPDATE OF title, author ON books BEGIN
+           INSERT INTO books_fts(books_fts, rowid, title, author)
+           VALUES ('delete', old.id, old.title, old.author);
+           INSERT INTO books_fts(rowid, title, author) VALUES (new.id, new.title, new.author);
+       END""",
+    "INSERT INTO books_fts(books_fts) VALUES ('rebuild')",
+)
+
+_SEARCH_INDEX_PROBE = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'books_fts'"
+
+# Trigrams need at least three characters; shorter terms fall back to LIKE
+_SEARCH_INDEX_MIN_TERM = 3
+
+# GLOB metacharacters, bracketed so a title prefix matches literally
+_GLOB_ESCAPES = str.maketrans({"*": "[*]", "?": "[?]", "[": "[[]"})
+
+# SearchCriteria.SortBy -> ORDER BY column; anything else sorts by title.
+# Only these fixed strings ever reach the SQL text
+_SORT_COLUMNS = {
+    "Title": "b.title",
+    "Authors": "b.author",
+    "Category": "c.category",
+    "Subject": "s.subject",
+    "Rating": "b.Rating",
+}
+
+
+@lru_cache(maxsize=64)
+def _Placeholders(Count: int) -> str:
+    """Comma-separated ? markers for an IN (...) list of Count values (memoized)."""
+    return ", ".join("?" * Count)
+
+
+# Read statements are served (and cached) without the write lock; matched in
+# place so the query text is not copied and upper-cased on every call
+_SELECT_PATTERN = re.compile(r"\s*SELECT\b", re.IGNORECASE)
+
+# Prepared statements kept per connection. Fixed queries are the constants above;
+# GetBooks/SearchBooks build a few dozen filter shapes, each with stable SQL text
+_STATEMENT_CACHE_SIZE = 256
+
+# Connection tuning applied to every connection
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-65536",  # 64 MB
+)
+
+# Set by the read-write connection only: the journal mode persists in the file,
+# and a mode=ro reader cannot switch a database that is not in WAL yet
+_WRITER_PRAGMAS = ("PRAGMA journal_mode=WAL",)
+
+
+class _ReaderConnection(sqlite3.Connection):
+    """Per-thread read-only connection; a subclass only so it can be weakly referenced."""
+
 
 class DatabaseManager:
     """
@@ -22,10 +184,55 @@ class DatabaseManager:
     Optimized for web/mobile deployment with minimal Google Drive interactions.
     """
     
+    # SELECT results remembered until the next write (entries, total rows, and
+    # total BLOB bytes across entries, since book rows carry their thumbnails)
+    ResultCacheSize = 128
+    ResultCacheRows = 5000
+    ResultCacheBytes = 32 * 1024 * 1024
+    
+    # Shared managers by resolved database path, handed out by Instance()
+    _Instances: Dict[str, "DatabaseManager"] = {}
+    _InstancesLock = threading.Lock()
+    
+    @classmethod
+    def Instance(cls, DatabasePath: str = "Data/Databases/MyLibrary.db") -> "DatabaseManager":
+        """
+        Get the shared manager for a database file, creating it on first use.
+        
+        Later callers reuse the open connections, caches and schema checks
+        instead of connecting and probing the file again.
+        
+        Args:
+            DatabasePath: Path to the SQLite database file
+            
+        Returns:
+            The DatabaseManager for that file
+        """
+        Key = str(Path(DatabasePath).resolve())
+        with cls._InstancesLock:
+            Manager = cls._Instances.get(Key)
+            if Manager is None:
+                Manager = cls._Instances[Key] = cls(DatabasePath)
+        Manager.Connect()  # Reopens a manager that was closed earlier
+        return Manager
+    
     def __init__(self, DatabasePath: str = "Data/Databases/MyLibrary.db"):
         self.DatabasePath = DatabasePath
-        self.Connection = None
-        self.Logger = logging.getLogger(self.__class__.__name__)
+        self.Connection = None  # Read-write connection opened by Connect(); all writes use it
+        self.Lock = threading.RLock()  # Serializes writes and the last-opened queue
+        # One read-only connection per thread so background readers never queue
+        # behind each other. Held only by the thread's local storage, so it is
+        # closed when the thread exits; the weak set lets Close() reach the rest
+        self._Readers = threading.local()
+        self._ReaderConnections: "weakref.WeakSet[sqlite3.Connection]" = weakref.WeakSet()
+        self._HasSearchIndex = False  # Set by EnsureSearchIndex() when FTS5 is usable
+        # Key -> (rows, BLOB bytes held by those rows)
+        self._ResultCache: "OrderedDict[Tuple[str, Tuple], Tuple[List[Tuple], int]]" = OrderedDict()
+        self._ResultCacheRowCount = 0
+        self._ResultCacheByteCount = 0
+        self._WriteGeneration = 0  # Bumped by every write; results read across one are not cached
+        self._LastOpenedQueue: Dict[int, str] = {}  # Book id -> pending last_opened timestamp
+        self.Logger = _LOGGER
         self.EnsureDatabaseDirectory()
         self.Connect()
     
@@ -35,77 +242,300 @@ class DatabaseManager:
         DatabaseDir.mkdir(parents=True, exist_ok=True)
     
     def Connect(self) -> bool:
-        """Connect to the SQLite database."""
+        """Connect to the SQLite database (a no-op if already connected)."""
         try:
-            self.Connection = sqlite3.connect(self.DatabasePath)
-            self.Connection.row_factory = sqlite3.Row  # Enable column access by name
+            if self.Connection is not None:
+                return True  # Reuse the open connection; __init__ already connected
+            
+            self.Connection = self._OpenConnection(ReadOnly=False)
+            
+            # Test connection and check for planner statistics in one probe
+            TableCount, HasStats = self.Connection.execute(_SCHEMA_PROBE_QUERY).fetchone()
             
-            # Test connection
-            Cursor = self.Connection.cursor()
-            Cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            Tables = Cursor.fetchall()
-            TableCount = len(Tables)
+            self._HasSearchIndex = self.EnsureSearchIndex()
             
-            self.Logger.info(f"Database connection successful: {TableCount} tables found")
+            # New indexes need fresh statistics before the planner will favour them
+            if self.EnsureIndexes() or not HasStats:
+                self.CollectStatistics()
+            
+            self.Logger.info("Database connection successful: %s tables found", TableCount)
             return True
             
         except Exception as Error:
-            self.Logger.error(f"Database connection failed: {Error}")
+            self.Logger.error("Database connection failed: %s", Error)
+            return False
+    
+    def EnsureIndexes(self) -> int:
+        """
+        Create the indexes the filter queries rely on, if they are missing.
+        
+        Returns:
+            Number of indexes created
+        """
+        try:
+            with self.Lock:
+                Existing = {Row[0] for Row in self.Connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )}
+                Missing = [Sql for Name, Sql in _SUPPORTING_INDEXES if Name not in Existing]
+                if Missing:
+                    with self.Connection:
+                        for Sql in Missing:
+                            self.Connection.execute(Sql)
+                    self.Logger.info("Created %s database indexes", len(Missing))
+                return len(Missing)
+        except sqlite3.Error as Error:
+            self.Logger.warning("Could not create database indexes: %s", Error)
+            return 0
+    
+    def EnsureSearchIndex(self) -> bool:
+        """
+        Create and populate the title/author full-text index if it is missing.
+        
+        Returns:
+            True if searches can use the index, False to keep using LIKE
+        """
+        try:
+            with self.Lock:
+                if self.Connection.execute(_SEARCH_INDEX_PROBE).fetchone():
+                    return True
+                with self.Connection:
+                    for Sql in _SEARCH_INDEX_STATEMENTS:
+                        self.Connection.execute(Sql)
+                self.Logger.info("Built full-text search index")
+                return True
+        except sqlite3.Error as Error:
+            # FTS5 (or its trigram tokenizer) is missing from this SQLite build
+            self.Logger.warning("Full-text search unavailable, using LIKE: %s", Error)
             return False
     
+    def CollectStatistics(self) -> None:
+        """Gather query planner statistics for a database that has none yet."""
+        try:
+            with self.Lock:
+                self.Connection.execute("ANALYZE")
+                self.Connection.commit()
+            self.Logger.info("Collected query planner statistics")
+        except sqlite3.Error as Error:
+            self.Logger.warning("Could not collect planner statistics: %s", Error)
+    
+    def _OpenConnection(self, ReadOnly: bool = True) -> sqlite3.Connection:
+        """
+        Open and tune a connection.
+        
+        Args:
+            ReadOnly: Open with mode=ro, so SQLite never takes a write lock or
+                keeps journal state for it (the per-thread readers)
+        """
+        if ReadOnly:
+            Uri = Path(self.DatabasePath).resolve().as_uri() + "?mode=ro"
+            Connection = sqlite3.connect(Uri, uri=True, check_same_thread=False,
+                                         cached_statements=_STATEMENT_CACHE_SIZE,
+                                         factory=_ReaderConnection)
+        else:
+            Connection = sqlite3.connect(self.DatabasePath, check_same_thread=False,
+                                         cached_statements=_STATEMENT_CACHE_SIZE)
+        # Rows stay plain tuples; every reader indexes columns by position
+        self.ApplyPragmas(Connection, ReadOnly)
+        return Connection
+    
+    def GetConnection(self) -> Optional[sqlite3.Connection]:
+        """
+        Get the calling thread's read-only connection, opening it on first use.
+        
+        Every thread, including the one that called Connect(), reads through its
+        own read-only connection; writes go through self.Connection.
+        
+        Returns:
+            Connection for this thread, or None if the database is closed
+        """
+        if self.Connection is None:
+            return None
+        Connection = getattr(self._Readers, "Connection", None)
+        if Connection is None:
+            Connection = self._Readers.Connection = self._OpenConnection()
+            with self.Lock:
+                self._ReaderConnections.add(Connection)
+        return Connection
+    
+    def ApplyPragmas(self, Connection: sqlite3.Connection, ReadOnly: bool = True) -> None:
+        """
+        Tune a connection for a read-heavy desktop workload.
+        
+        WAL lets background readers run alongside the occasional write, and the
+        larger page cache plus memory-mapped I/O keep repeat JOINs off the disk.
+        Each pragma is applied on its own, so one that the medium refuses (WAL
+        on read-only or network storage) does not cost the others.
+        
+        Args:
+            Connection: Connection to tune
+            ReadOnly: True for a reader, which leaves the journal mode to the writer
+        """
+        Pragmas = _CONNECTION_PRAGMAS if ReadOnly else _WRITER_PRAGMAS + _CONNECTION_PRAGMAS
+        for Pragma in Pragmas:
+            try:
+                Connection.execute(Pragma)
+            except sqlite3.Error as Error:
+                self.Logger.warning("Could not apply %s: %s", Pragma, Error)
+    
     def Close(self):
         """Close the database connection properly."""
         try:
             if self.Connection:
-                self.Connection.close()
-                self.Connection = None
+                self.FlushLastOpened()
+                with self.Lock:
+                    for Connection in list(self._ReaderConnections):
+                        Connection.close()
+                    self._ReaderConnections.clear()
+                    self._Readers = threading.local()  # Drop the closed readers
+                    self.Connection.close()
+                    self.Connection = None
                 self.Logger.info("Database connection closed successfully")
         except Exception as Error:
-            self.Logger.error(f"Error closing database connection: {Error}")
+            self.Logger.error("Error closing database connection: %s", Error)
     
-    def ExecuteQuery(self, Query: str, Parameters: Tuple = ()) -> List[sqlite3.Row]:
+    def ExecuteQuery(self, Query: str, Parameters: Tuple = ()) -> List[Tuple]:
         """Execute a SQL query with proper error handling."""
         try:
-            if not self.Connection:
+            Connection = self.GetConnection()
+            if not Connection:
                 self.Logger.error("No database connection available")
                 return []
             
-            Cursor = self.Connection.cursor()
-            Cursor.execute(Query, Parameters)
+            # For SELECT queries, return results (reads need no lock on a per-thread connection)
+            if _SELECT_PATTERN.match(Query):
+                Key = (Query, Parameters)
+                with self.Lock:
+                    Cached = self._ResultCache.get(Key)
+                    if Cached is not None:
+                        self._ResultCache.move_to_end(Key)
+                        return list(Cached[0])
+                    Generation = self._WriteGeneration
+                
+                Results = Connection.execute(Query, Parameters).fetchall()
+                self._CacheResult(Key, Results, Generation)
+                return list(Results)
             
-            # For SELECT queries, return results
-            if Query.strip().upper().startswith('SELECT'):
-                Results = Cursor.fetchall()
-                return Results
-            else:
-                # For INSERT/UPDATE/DELETE queries, commit changes
+            # For INSERT/UPDATE/DELETE queries, commit changes on the read-write connection
+            with self.Lock:
+                self.Connection.execute(Query, Parameters)
                 self.Connection.commit()
+                self.ClearResultCache()
                 return []
                 
         except sqlite3.Error as Error:
-            self.Logger.error(f"Database error: {Error}")
-            self.Logger.error(f"Query execution failed: {Query} - {Error}")
+            self.Logger.error("Database error: %s", Error)
+            self.Logger.error("Query execution failed: %s - %s", Query, Error)
             return []
         except Exception as Error:
-            self.Logger.error(f"Unexpected error executing query: {Error}")
+            self.Logger.error("Unexpected error executing query: %s", Error)
             return []
     
-    def GetBooks(self, Category: str = "", Subject: str = "", SearchTerm: str = "") -> List[Dict[str, Any]]:
+    def ExecuteMany(self, Query: str, ParameterList: Iterable[Tuple]) -> int:
+        """
+        Run one write statement for every parameter tuple in a single transaction.
+        
+        Use this for burst writes instead of looping ExecuteQuery, which commits
+        (and syncs) after every row.
+        
+        Args:
+            Query: INSERT/UPDATE/DELETE statement with ? placeholders
+            ParameterList: One parameter tuple per row
+            
+        Returns:
+            Number of rows changed (0 on failure)
+        """
+        try:
+            with self.Lock:
+                Connection = self.Connection
+                if not Connection:
+                    self.Logger.error("No database connection available")
+                    return 0
+                
+                with Connection:
+                    Cursor = Connection.executemany(Query, ParameterList)
+                self.ClearResultCache()
+                return Cursor.rowcount
+                
+        except sqlite3.Error as Error:
+            self.Logger.error("Batch execution failed: %s - %s", Query, Error)
+            return 0
+    
+    def _IterQuery(self, Query: str, Parameters: Tuple = ()) -> Iterator[Tuple]:
+        """
+        Yield SELECT rows straight from the cursor, bypassing the result cache.
+        
+        For one-off bulk reads whose caller keeps its own converted copy, so the
+        raw row list is never materialized alongside it.
+        
+        Raises:
+            sqlite3.Error: If the query fails, including part way through the
+                rows, so callers never mistake a truncated result for a full one
+        """
+        Connection = self.GetConnection()
+        if not Connection:
+            self.Logger.error("No database connection available")
+            return
+        yield from Connection.execute(Query, Parameters)
+    
+    def _CacheResult(self, Key: Tuple[str, Tuple], Results: List[Tuple], Generation: int) -> None:
+        """
+        Remember a SELECT result, evicting least recently used entries over budget.
+        
+        Args:
+            Key: (Query, Parameters) the result was read for
+            Results: Rows returned by the query
+            Generation: _WriteGeneration read before the query ran; if a write
+                has happened since, the rows may predate it and are dropped
+        """
+        if len(Results) > self.ResultCacheRows:
+            return
+        
+        ByteCount = sum(len(Value) for Row in Results for Value in Row if isinstance(Value, bytes))
+        if ByteCount > self.ResultCacheBytes:
+            return
+        
+        with self.Lock:
+            if Generation != self._WriteGeneration:
+                return
+            
+            Previous = self._ResultCache.pop(Key, None)
+            if Previous is not None:
+                self._ResultCacheRowCount -= len(Previous[0])
+                self._ResultCacheByteCount -= Previous[1]
+            
+            self._ResultCache[Key] = (Results, ByteCount)
+            self._ResultCacheRowCount += len(Results)
+            self._ResultCacheByteCount += ByteCount
+            
+            while (len(self._ResultCache) > self.ResultCacheSize
+                   or self._ResultCacheRowCount > self.ResultCacheRows
+                   or self._ResultCacheByteCount > self.ResultCacheBytes):
+                _, (Evicted, EvictedBytes) = self._ResultCache.popitem(last=False)
+                self._ResultCacheRowCount -= len(Evicted)
+                self._ResultCacheByteCount -= EvictedBytes
+    
+    def ClearResultCache(self) -> None:
+        """Forget all cached SELECT results (called after every write)."""
+        with self.Lock:
+            self._WriteGeneration += 1
+            self._ResultCache.clear()
+            self._ResultCacheRowCount = 0
+            self._ResultCacheByteCount = 0
+    
+    def GetBooks(self, Category: str = "", Subject: str = "", SearchTerm: str = "",
+                 Limit: Optional[int] = None, Offset: int = 0,
+                 TitlePrefix: str = "") -> List[Dict[str, Any]]:
         """
         NEW SCHEMA - Get books using JOINs for relational schema.
         Returns books with category/subject names and BLOB thumbnail data.
+        Pass Limit/Offset to fetch one page of the title-ordered result.
+        TitlePrefix keeps titles starting with it (case-sensitive), read as a
+        range of the title index rather than a scan.
         """
         try:
             # NEW SCHEMA: Use JOINs to get category and subject names
-            Query = """
-                SELECT b.id, b.title, b.author, b.FilePath, b.ThumbnailImage,
-                       c.category as Category, s.subject as Subject,
-                       b.last_opened, b.Rating, b.Notes
-                FROM books b
-                LEFT JOIN categories c ON b.category_id = c.id
-                LEFT JOIN subjects s ON b.subject_id = s.id
-                WHERE 1=1
-            """
+            Query = _BOOK_SELECT + " WHERE 1=1"
             Parameters = []
             
             if Category and Category != "All Categories":
@@ -117,47 +547,230 @@ class DatabaseManager:
                 Parameters.append(Subject)
             
             if SearchTerm:
-                Query += " AND (b.title LIKE ? OR b.author LIKE ?)"
-                SearchPattern = f"%{SearchTerm}%"
-                Parameters.extend([SearchPattern, SearchPattern])
+                Condition, Values = self._SearchTermFilter(SearchTerm)
+                Query += " AND " + Condition
+                Parameters.extend(Values)
+            
+            if TitlePrefix:
+                Query += " AND b.title GLOB ?"
+                Parameters.append(TitlePrefix.translate(_GLOB_ESCAPES) + "*")
             
             Query += " ORDER BY b.title"
             
-            Rows = self.ExecuteQuery(Query, tuple(Parameters))
-            
-            # Convert rows to dictionaries with proper field names
-            Books = []
-            for Row in Rows:
-                BookDict = {
-                    'id': Row['id'],
-                    'Title': Row['title'],
-                    'Author': Row['author'] or 'Unknown Author',  
-                    'Category': Row['Category'] or 'General',
-                    'Subject': Row['Subject'] or 'General',
-                    'FilePath': Row['FilePath'] or '',
-                    'ThumbnailData': Row['ThumbnailImage'],  # BLOB data for thumbnail
-                    'LastOpened': Row['last_opened'],
-                    'Rating': Row['Rating'] or 0,
-                    'Notes': Row['Notes'] or ''
-                }
-                Books.append(BookDict)
-            
-            self.Logger.info(f"Retrieved {len(Books)} books using new relational schema")
+            if Limit is not None:
+                Query += " LIMIT ? OFFSET ?"
+                Parameters.extend([Limit, Offset])
+            
+            if Parameters:
+                Books = self._RowsToBookDicts(self.ExecuteQuery(Query, tuple(Parameters)))
+            else:
+                # Whole library: loaded once and kept by BookService, so stream it
+                Books = self._RowsToBookDicts(self._IterQuery(Query))
+            
+            self.Logger.info("Retrieved %s books using new relational schema", len(Books))
             return Books
             
         except Exception as Error:
-            self.Logger.error(f"Failed to get books: {Error}")
+            self.Logger.error("Failed to get books: %s", Error)
             return []
     
+    def SearchBooks(self, Criteria: "SearchCriteria") -> List[Dict[str, Any]]:
+        """
+        Get books matching every filter set in a SearchCriteria.
+        
+        Each list filter (Categories, Subjects, Authors) matches any of its
+        values exactly. Results follow SortBy/SortOrder (ties by title), and
+        Limit/Offset page them.
+        
+        Args:
+            Criteria: Search term, list filters, rating bounds and paging
+            
+        Returns:
+            List of matching Book dictionaries
+        """
+        try:
+            Conditions: List[str] = []
+            Parameters: List[Any] = []
+            
+            if Criteria.SearchTerm:
+                Condition, Values = self._SearchTermFilter(Criteria.SearchTerm)
+                Conditions.append(Condition)
+                Parameters.extend(Values)
+            
+            for Column, Values in (("c.category", Criteria.Categories),
+                                   ("s.subject", Criteria.Subjects),
+                                   ("b.author", Criteria.Authors)):
+                if Values:
+                    Conditions.append(f"{Column} IN ({_Placeholders(len(Values))})")
+                    Parameters.extend(Values)
+            
+            # Unrated books are shown as 0, so compare them as 0
+            if Criteria.MinRating is not None:
+                Conditions.append("COALESCE(b.Rating, 0) >= ?")
+                Parameters.append(Criteria.MinRating)
+            if Criteria.MaxRating is not None:
+                Conditions.append("COALESCE(b.Rating, 0) <= ?")
+                Parameters.append(Criteria.MaxRating)
+            
+            Query = _BOOK_SELECT
+            if Conditions:
+                Query += " WHERE " + " AND ".join(Conditions)
+            
+            SortColumn = _SORT_COLUMNS.get(Criteria.SortBy, "b.title")
+            SortOrder = "DESC" if Criteria.SortOrder.upper() == "DESC" else "ASC"
+            Query += f" ORDER BY {SortColumn} {SortOrder}"
+            if SortColumn != "b.title":
+                Query += ", b.title"
+            
+            if Criteria.Limit is not None:
+                Query += " LIMIT ? OFFSET ?"
+                Parameters.extend([Criteria.Limit, Criteria.Offset])
+            
+            Books = self._RowsToBookDicts(self.ExecuteQuery(Query, tuple(Parameters)))
+            self.Logger.info("Criteria search returned %s books", len(Books))
+            return Books
+            
+        except Exception as Error:
+            self.Logger.error("Failed to search books: %s", Error)
+            return []
+    
+    def _SearchTermFilter(self, SearchTerm: str) -> Tuple[str, List[str]]:
+        """SQL condition and parameters matching SearchTerm within a title or author."""
+        if self._HasSearchIndex and len(SearchTerm) >= _SEARCH_INDEX_MIN_TERM:
+            # Quoted as one phrase: a case-insensitive substring match on either column
+            return ("b.id IN (SELECT rowid FROM books_fts WHERE books_fts MATCH ?)",
+                    ['"' + SearchTerm.replace('"', '""') + '"'])
+        
+        SearchPattern = f"%{SearchTerm}%"
+        return "(b.title LIKE ? OR b.author LIKE ?)", [SearchPattern, SearchPattern]
+    
+    def GetBookById(self, BookId: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a single book by primary key.
+        
+        Args:
+            BookId: Database ID of the book
+            
+        Returns:
+            Book dictionary, or None if not found
+        """
+        try:
+            Rows = self.ExecuteQuery(_BOOK_BY_ID_QUERY, (BookId,))
+            return self._RowToBookDict(Rows[0]) if Rows else None
+        except Exception as Error:
+            self.Logger.error("Failed to get book ID %s: %s", BookId, Error)
+            return None
+    
+    def GetBooksByIds(self, BookIds: Iterable[int]) -> List[Dict[str, Any]]:
+        """
+        Get the books with the given ids, in title order.
+        
+        Ids are sorted first, so the same set always produces the same SQL and
+        parameters and repeat lookups are served from the result cache.
+        
+        Args:
+            BookIds: Database IDs of the books; unknown ids are ignored
+            
+        Returns:
+            List of matching Book dictionaries
+        """
+        try:
+            Ids = sorted(set(BookIds))
+            Rows: List[Tuple] = []
+            for Start in range(0, len(Ids), _ID_BATCH_SIZE):
+                Batch = tuple(Ids[Start:Start + _ID_BATCH_SIZE])
+                Query = _BOOK_SELECT + f" WHERE b.id IN ({_Placeholders(len(Batch))}) ORDER BY b.title, b.id"
+                Rows.extend(self.ExecuteQuery(Query, Batch))
+            
+            if len(Ids) > _ID_BATCH_SIZE:
+                Rows.sort(key=lambda Row: (Row[1], Row[0]))  # Merge the batches by title
+            return self._RowsToBookDicts(Rows)
+            
+        except Exception as Error:
+            self.Logger.error("Failed to get books by id: %s", Error)
+            return []
+    
+    def GetBookFile(self, BookIdentifier) -> Optional[Dict[str, Any]]:
+        """
+        Look up just the id, title and file path of one book.
+        
+        Args:
+            BookIdentifier: Exact title (str) or database ID (int)
+            
+        Returns:
+            Dictionary with id, Title and FilePath, or None if not found
+        """
+        try:
+            Query = _BOOK_FILE_BY_TITLE_QUERY if isinstance(BookIdentifier, str) else _BOOK_FILE_BY_ID_QUERY
+            Rows = self.ExecuteQuery(Query, (BookIdentifier,))
+            if not Rows:
+                return None
+            BookId, Title, FilePath = Rows[0]
+            return {'id': BookId, 'Title': Title, 'FilePath': FilePath or ''}
+        except Exception as Error:
+            self.Logger.error("Failed to get file for book %s: %s", BookIdentifier, Error)
+            return None
+    
+    @staticmethod
+    def _RowToBookDict(Row: Tuple) -> Dict[str, Any]:
+        """
+        Convert one joined book row to a dictionary with proper field names.
+        
+        Columns are read by position, in _BOOK_SELECT order: id, title, author,
+        FilePath, ThumbnailImage, Category, Subject, last_opened, Rating, Notes.
+        """
+        return {
+            'id': Row[0],
+            'Title': Row[1],
+            'Author': Row[2] or 'Unknown Author',
+            'Category': Row[5] or 'General',
+            'Subject': Row[6] or 'General',
+            'FilePath': Row[3] or '',
+            'ThumbnailData': Row[4],  # BLOB data for thumbnail
+            'LastOpened': Row[7],
+            'Rating': Row[8] or 0,
+            'Notes': Row[9] or ''
+        }
+    
+    def _RowsToBookDicts(self, Rows: Iterable[Tuple]) -> List[Dict[str, Any]]:
+        """Convert joined book rows to dictionaries with proper field names."""
+        RowToBookDict = self._RowToBookDict
+        return [RowToBookDict(Row) for Row in Rows]
+    
+    def GetCategorySubjectIndex(self) -> Dict[str, Dict[str, List[int]]]:
+        """
+        Build a category -> subject -> book id map in a single pass.
+        
+        Returns:
+            Nested dictionary of book ids, each list in title order; books with
+            no category or subject are listed under ''
+        """
+        try:
+            # defaultdict: no throwaway {} / [] per row as with setdefault
+            Builder: DefaultDict[str, DefaultDict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+            BookCount = 0
+            for Category, Subject, BookId in self._IterQuery(_CATEGORY_SUBJECT_INDEX_QUERY):
+                Builder[Category][Subject].append(BookId)
+                BookCount += 1
+            
+            # Plain dicts, so looking up an unknown name cannot insert an entry
+            Index = {Category: dict(Subjects) for Category, Subjects in Builder.items()}
+            
+            self.Logger.info("Built filter index for %s books in %s categories", BookCount, len(Index))
+            return Index
+        except Exception as Error:
+            self.Logger.error("Failed to build category/subject index: %s", Error)
+            return {}
+    
     def GetCategories(self) -> List[str]:
         """NEW SCHEMA - Get categories from categories table."""
         try:
-            Rows = self.ExecuteQuery("SELECT category FROM categories ORDER BY category")
-            Categories = [Row[0] for Row in Rows if Row[0]]
-            self.Logger.info(f"Retrieved {len(Categories)} categories from categories table")
+            Rows = self.ExecuteQuery(_CATEGORIES_QUERY)
+            Categories = [Row[0] for Row in Rows]
+            self.Logger.info("Retrieved %s categories from categories table", len(Categories))
             return Categories
         except Exception as Error:
-            self.Logger.error(f"Failed to get categories: {Error}")
+            self.Logger.error("Failed to get categories: %s", Error)
             return []
     
     def GetSubjects(self, Category: str = "") -> List[str]:
@@ -165,61 +778,101 @@ class DatabaseManager:
         try:
             if Category and Category != "All Categories":
                 # Get subjects for specific category
-                Query = """
-                    SELECT DISTINCT s.subject 
-                    FROM subjects s
-                    JOIN categories c ON s.category_id = c.id
-                    WHERE c.category = ?
-                    ORDER BY s.subject
-                """
+                Query = _CATEGORY_SUBJECTS_QUERY
                 Parameters = (Category,)
             else:
                 # Get all subjects
-                Query = "SELECT DISTINCT subject FROM subjects ORDER BY subject"
+                Query = _ALL_SUBJECTS_QUERY
                 Parameters = ()
             
             Rows = self.ExecuteQuery(Query, Parameters)
-            Subjects = [Row[0] for Row in Rows if Row[0]]
-            self.Logger.info(f"Retrieved {len(Subjects)} subjects for category '{Category}'")
+            Subjects = [Row[0] for Row in Rows]
+            self.Logger.info("Retrieved %s subjects for category '%s'", len(Subjects), Category)
             return Subjects
         except Exception as Error:
-            self.Logger.error(f"Failed to get subjects: {Error}")
+            self.Logger.error("Failed to get subjects: %s", Error)
+            return []
+    
+    def GetCategorySubjectPairs(self) -> List[Tuple[str, Optional[str]]]:
+        """
+        Get every (category, subject) pair in one query, in name order.
+        
+        Returns:
+            Pairs sorted by category then subject; subject is None for a
+            category that has no subjects
+        """
+        try:
+            return self.ExecuteQuery(_CATEGORY_SUBJECT_PAIRS_QUERY)
+        except Exception as Error:
+            self.Logger.error("Failed to get category/subject pairs: %s", Error)
             return []
     
     def UpdateLastOpened(self, BookTitle: str):
         """Update last opened timestamp for a book."""
         try:
-            from datetime import datetime
             Timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
             # Update using book title
-            self.ExecuteQuery("UPDATE books SET last_opened = ? WHERE title = ?", (Timestamp, BookTitle))
-            self.Logger.info(f"Updated last_opened for book: {BookTitle}")
+            self.ExecuteQuery(_UPDATE_LAST_OPENED_BY_TITLE, (Timestamp, BookTitle))
+            self.Logger.info("Updated last_opened for book: %s", BookTitle)
             
         except Exception as Error:
-            self.Logger.warning(f"Could not update last opened time: {Error}")
+            self.Logger.warning("Could not update last opened time: %s", Error)
+    
+    def QueueLastOpened(self, BookId: int) -> str:
+        """
+        Record that a book was opened without writing to the database yet.
+        
+        Args:
+            BookId: Database ID of the opened book
+            
+        Returns:
+            The timestamp that will be written
+        """
+        Timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.Lock:
+            self._LastOpenedQueue[BookId] = Timestamp
+        return Timestamp
+    
+    def FlushLastOpened(self) -> int:
+        """
+        Write all queued last_opened timestamps in one transaction.
+        
+        Returns:
+            Number of books updated
+        """
+        try:
+            with self.Lock:
+                if not self._LastOpenedQueue or not self.Connection:
+                    return 0
+                
+                Batch = [(Timestamp, BookId) for BookId, Timestamp in self._LastOpenedQueue.items()]
+                self._LastOpenedQueue.clear()
+                
+                self.ExecuteMany(_UPDATE_LAST_OPENED_BY_ID, Batch)
+            
+            self.Logger.info("Updated last_opened for %s books", len(Batch))
+            return len(Batch)
+            
+        except Exception as Error:
+            self.Logger.warning("Could not flush last opened times: %s", Error)
+            return 0
     
     def GetDatabaseStats(self) -> Dict[str, int]:
         """Get database statistics from the new schema."""
         Stats = {}
         
         try:
-            # Get category count
-            CategoryRows = self.ExecuteQuery("SELECT COUNT(*) FROM categories")
-            Stats['Categories'] = CategoryRows[0][0] if CategoryRows else 0
-            
-            # Get subject count  
-            SubjectRows = self.ExecuteQuery("SELECT COUNT(*) FROM subjects")
-            Stats['Subjects'] = SubjectRows[0][0] if SubjectRows else 0
-            
-            # Get book count
-            BookRows = self.ExecuteQuery("SELECT COUNT(*) FROM books")
-            Stats['Books'] = BookRows[0][0] if BookRows else 0
+            # Category, subject and book counts in one round trip
+            Rows = self.ExecuteQuery(_DATABASE_STATS_QUERY)
+            Counts = tuple(Rows[0]) if Rows else (0, 0, 0)
+            Stats['Categories'], Stats['Subjects'], Stats['Books'] = Counts
             
-            self.Logger.info(f"Database stats: {Stats['Books']} books, {Stats['Categories']} categories, {Stats['Subjects']} subjects")
+            self.Logger.info("Database stats: %s books, %s categories, %s subjects",
+                             Stats['Books'], Stats['Categories'], Stats['Subjects'])
             
         except Exception as Error:
-            self.Logger.error(f"Failed to get database stats: {Error}")
+            self.Logger.error("Failed to get database stats: %s", Error)
             Stats = {'Categories': 0, 'Subjects': 0, 'Books': 0}
         
         return Stats
@@ -235,10 +888,10 @@ class DatabaseManager:
             BLOB data as bytes, or None if not found
         """
         try:
-            Rows = self.ExecuteQuery("SELECT ThumbnailImage FROM books WHERE id = ?", (BookId,))
+            Rows = self.ExecuteQuery(_THUMBNAIL_QUERY, (BookId,))
             if Rows and Rows[0][0]:
                 return Rows[0][0]  # Return BLOB data
             return None
         except Exception as Error:
-            self.Logger.error(f"Failed to get thumbnail for book ID {BookId}: {Error}")
+            self.Logger.error("Failed to get thumbnail for book ID %s: %s", BookId, Error)
             return None
\ No newline at end of file
@@ -2,7 +2,7 @@
 # Path: Source/Interface/BookGrid.py
 # Standard: AIDEV-PascalCase-1.8
 # Created: 2025-07-06
-# Last Modified: 2025-07-06  11:26AM
+# Last Modified: 2026-10-17  03:55PM
 """
 Description: Fixed Book Grid with Proper PySide6 Imports
 Enhanced book display grid with proper imports and resize handling.
@@ -10,17 +10,196 @@ Enhanced book display grid with proper imports and resize handling.
 
 import logging
 import math
-from typing import List, Dict, Optional
+import os
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+import shiboken6
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QFrame, QLabel,
     QPushButton, QGridLayout, QSizePolicy, QApplication
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QSize
-from PySide6.QtGui import QPixmap, QFont, QPainter, QBrush, QColor
+from PySide6.QtCore import Qt, Signal, QTimer, QSize, QObject, QThreadPool
+from PySide6.QtGui import QPixmap, QImage, QFont, QPainter, QBrush, QColor
 
 from Source.Core.BookService import BookService
+from Source.Utils.BackgroundTask import BackgroundTask
+
+# One logger for the grid, its loader and every card
+_LOGGER = logging.getLogger(__name__)
+
+
+# Scroll area and book card stylesheet, built once at import and shared by every grid;
+# cards match by object name so each card needs no stylesheet of its own
+_BOOK_GRID_STYLESHEET = """
+QScrollArea {
+    border: none;
+    background-color: transparent;
+}
+
+QScrollBar:vertical {
+    background-color: #19FFFFFF;
+    width: 16px;
+    border-radius: 8px;
+    margin: 0;
+}
+
+QScrollBar::handle:vertical {
+    background-color: #4CFFFFFF;
+    border-radius: 8px;
+    min-height: 30px;
+    margin: 2px;
+}
+
+QScrollBar::handle:vertical:hover {
+    background-color: #7FFFFFFF;
+}
+
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    border: none;
+    background: none;
+}
+
+QFrame#BookCard {
+    background-color: #19FFFFFF;
+    border-radius: 10px;
+}
+
+QFrame#BookCard:hover {
+    background-color: #33FFFFFF;
+    border: 3px solid #FFC107;
+}
+
+QLabel#BookCover {
+    border: 2px solid #4CAF50;
+    border-radius: 8px;
+    background-color: #E5FFFFFF;
+    padding: 2px;
+}
+
+QLabel#ListTitle, QLabel#GridTitle {
+    color: #FFFFFF;
+    font-weight: bold;
+    background-color: #B2000000;
+    border-radius: 4px;
+}
+
+QLabel#ListTitle {
+    font-size: 14px;
+    padding: 8px;
+}
+
+QLabel#GridTitle {
+    font-size: 12px;
+    padding: 4px;
+}
+"""
+
+
+def _DecodeThumbnail(Blob: bytes, Width: int, Height: int) -> QImage:
+    """Decode and scale a cover BLOB; safe to call off the GUI thread."""
+    Image = QImage.fromData(Blob)
+    if Image.isNull():
+        return Image
+    return Image.scaled(Width, Height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+class ThumbnailLoader(QObject):
+    """
+    Decodes cover BLOBs on the thread pool and keeps the scaled pixmaps in an LRU cache.
+    
+    Cards that ask for a cover that is not cached yet are handed it once the
+    worker finishes; cards deleted in the meantime are skipped.
+    """
+    
+    # Decoded covers kept across grid refreshes
+    CacheSize = 512
+    
+    # Fallback cover image files, named <book id>.jpg
+    CoverDirectory = Path("Data/Covers")
+    
+    def __init__(self):
+        super().__init__()
+        
+        self.Logger = _LOGGER
+        self._Cache: "OrderedDict[Tuple[int, int, int], QPixmap]" = OrderedDict()
+        self._Waiting: Dict[Tuple[int, int, int], List["BookCard"]] = {}
+        self._CoverFiles: Optional[frozenset] = None  # File names in CoverDirectory, listed on first use
+    
+    def Request(self, Card: "BookCard", BookId: int, Blob: bytes,
+                Width: int, Height: int) -> Optional[QPixmap]:
+        """
+        Get a scaled cover, scheduling a background decode on a cache miss.
+        
+        Args:
+            Card: Card to receive the cover via SetCover() when decoded
+            BookId: Database ID of the book
+            Blob: Encoded thumbnail image data
+            Width: Target width
+            Height: Target height
+            
+        Returns:
+            The cached pixmap, or None if it will be delivered later
+        """
+        Key = (BookId, Width, Height)
+        Pixmap = self._Cache.get(Key)
+        if Pixmap is not None:
+            self._Cache.move_to_end(Key)
+            return Pixmap
+        
+        Waiting = self._Waiting.get(Key)
+        if Waiting is not None:
+            Waiting.append(Card)
+            return None
+        
+        self._Waiting[Key] = [Card]
+        Task = BackgroundTask(lambda: (Key, _DecodeThumbnail(Blob, Width, Height)))
+        Task.Signals.Finished.connect(self._OnDecoded)
+        QThreadPool.globalInstance().start(Task)
+        return None
+    
+    def _OnDecoded(self, Result: Tuple[Tuple[int, int, int], QImage]) -> None:
+        """Cache a decoded cover and hand it to the cards still waiting for it."""
+        Key, Image = Result
+        Cards = self._Waiting.pop(Key, [])
+        
+        Pixmap = None
+        if Image.isNull():
+            self.Logger.warning(f"Failed to load thumbnail BLOB for book {Key[0]}")
+        else:
+            Pixmap = QPixmap.fromImage(Image)
+            self._Cache[Key] = Pixmap
+            while len(self._Cache) > self.CacheSize:
+                self._Cache.popitem(last=False)
+        
+        for Card in Cards:
+            if shiboken6.isValid(Card):
+                Card.SetCover(Pixmap)
+    
+    def HasCoverFile(self, FileName: str) -> bool:
+        """
+        Check for a fallback cover file without a stat call per card.
+        
+        Args:
+            FileName: Cover file name inside CoverDirectory
+            
+        Returns:
+            True if the file was present when the directory was listed
+        """
+        if self._CoverFiles is None:
+            try:
+                with os.scandir(self.CoverDirectory) as Entries:
+                    self._CoverFiles = frozenset(Entry.name for Entry in Entries if Entry.is_file())
+            except OSError:
+                self._CoverFiles = frozenset()
+        return FileName in self._CoverFiles
+    
+    def Clear(self) -> None:
+        """Drop all cached covers and the cover file listing."""
+        self._Cache.clear()
+        self._CoverFiles = None
 
 
 class BookCard(QFrame):
@@ -28,14 +207,19 @@ class BookCard(QFrame):
     Individual book card widget with enhanced styling.
     """
     
-    BookClicked = Signal(dict)
+    BookClicked = Signal(int)  # Emits the book's primary key
+    
+    # "No cover" pixmaps by view mode, painted once and shared by every card
+    _Placeholders: Dict[str, QPixmap] = {}
     
-    def __init__(self, BookData: dict, ViewMode: str = "grid"):
+    def __init__(self, BookData: dict, ViewMode: str = "grid",
+                 Loader: Optional[ThumbnailLoader] = None):
         super().__init__()
         
         self.BookData = BookData
         self.ViewMode = ViewMode
-        self.Logger = logging.getLogger(__name__)
+        self.Loader = Loader
+        self.Logger = _LOGGER
         
         # Set up the card
         self._SetupCard()
@@ -72,66 +256,65 @@ class BookCard(QFrame):
             self.CoverLabel.setMinimumSize(160, 200)
             self.CoverLabel.setMaximumSize(160, 200)
             
-        self.CoverLabel.setStyleSheet("""
-            QLabel {
-                border: 2px solid #4CAF50;
-                border-radius: 8px;
-                background-color: rgba(255, 255, 255, 0.9);
-                padding: 2px;
-            }
-        """)
+        self.CoverLabel.setObjectName("BookCover")
         Layout.addWidget(self.CoverLabel)
         
         # Title label
-        Title = self.BookData.get('Title', 'Unknown Title')
+        self.TitleLabel = QLabel(self._DisplayTitle())
         if self.ViewMode == "list":
-            # Full title for list view
-            self.TitleLabel = QLabel(Title)
             self.TitleLabel.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
             self.TitleLabel.setWordWrap(True)
-            self.TitleLabel.setStyleSheet("""
-                QLabel {
-                    color: #FFFFFF;
-                    font-size: 14px;
-                    font-weight: bold;
-                    background-color: rgba(0, 0, 0, 0.7);
-                    border-radius: 4px;
-                    padding: 8px;
-                }
-            """)
+            self.TitleLabel.setObjectName("ListTitle")
         else:
-            # Truncated title for grid view
-            self.TitleLabel = QLabel(Title[:25] + "..." if len(Title) > 25 else Title)
             self.TitleLabel.setAlignment(Qt.AlignCenter)
             self.TitleLabel.setWordWrap(True)
-            self.TitleLabel.setStyleSheet("""
-                QLabel {
-                    color: #FFFFFF;
-                    font-size: 12px;
-                    font-weight: bold;
-                    background-color: rgba(0, 0, 0, 0.7);
-                    border-radius: 4px;
-                    padding: 4px;
-                }
-            """)
+            self.TitleLabel.setObjectName("GridTitle")
         Layout.addWidget(self.TitleLabel)
         
-        # Set hover effects
-        self.setStyleSheet("""
-            QFrame {
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 10px;
-            }
-            QFrame:hover {
-                background-color: rgba(255, 255, 255, 0.2);
-                border: 3px solid #FFC107;
-            }
-        """)
+        # Card and hover styling come from the grid stylesheet, matched by object
+        # name so child QLabels, which are QFrames too, do not re-match the card rules
+        self.setObjectName("BookCard")
+    
+    def _DisplayTitle(self) -> str:
+        """Title text for the card: full in list view, truncated in grid view"""
+        Title = self.BookData.get('Title', 'Unknown Title')
+        if self.ViewMode != "list" and len(Title) > 25:
+            return Title[:25] + "..."
+        return Title
+    
+    def SetBookData(self, BookData: dict) -> None:
+        """
+        Point a recycled card at the current record of its book.
+        
+        The record may have changed since the card was built (e.g. after Refresh
+        Library), so the title and cover are redrawn when they differ.
+        
+        Args:
+            BookData: Book dictionary for the same book id
+        """
+        Previous = self.BookData
+        self.BookData = BookData
+        
+        if BookData.get('Title') != Previous.get('Title'):
+            self.TitleLabel.setText(self._DisplayTitle())
+        if BookData.get('ThumbnailData') != Previous.get('ThumbnailData'):
+            self._LoadBookCover()
     
     def _LoadBookCover(self) -> None:
         """Load and display the book cover"""
         try:
             # Try to load cover from BLOB data first
+            if self.Loader and self.BookData.get('ThumbnailData') and self.BookData.get('id') is not None:
+                # Decode off the GUI thread; the placeholder shows until SetCover()
+                Width, Height = (56, 56) if self.ViewMode == "list" else (156, 196)
+                Pixmap = self.Loader.Request(self, self.BookData['id'],
+                                             self.BookData['ThumbnailData'], Width, Height)
+                if Pixmap is None:
+                    self._CreatePlaceholder()
+                else:
+                    self.CoverLabel.setPixmap(Pixmap)
+                return
+            
             if 'ThumbnailData' in self.BookData and self.BookData['ThumbnailData']:
                 Pixmap = QPixmap()
                 if Pixmap.loadFromData(self.BookData['ThumbnailData']):
@@ -147,14 +330,19 @@ class BookCard(QFrame):
                     self.CoverLabel.setPixmap(ScaledPixmap)
                     return
                 else:
-                    self.Logger.warning(f"Failed to load thumbnail BLOB for book {self.BookData.get('ID', 'Unknown')}")
+                    self.Logger.warning(f"Failed to load thumbnail BLOB for book {self.BookData.get('id', 'Unknown')}")
             
-            # Fallback to file-based cover
-            CoverPath = Path(f"Data/Covers/{self.BookData.get('ID', 0)}.jpg")
-            if CoverPath.exists():
+            # Fallback to file-based cover, named by book id
+            BookId = self.BookData.get('id')
+            HasCover = False
+            if BookId is not None:
+                CoverName = f"{BookId}.jpg"
+                CoverPath = ThumbnailLoader.CoverDirectory / CoverName
+                HasCover = self.Loader.HasCoverFile(CoverName) if self.Loader else CoverPath.exists()
+            if HasCover:
                 Pixmap = QPixmap(str(CoverPath))
                 if Pixmap.isNull():
-                    self.Logger.warning(f"Failed to load file-based cover from {CoverPath} for book {self.BookData.get('ID', 'Unknown')}")
+                    self.Logger.warning(f"Failed to load file-based cover from {CoverPath} for book {self.BookData.get('id', 'Unknown')}")
                 if self.ViewMode == "list":
                     ScaledPixmap = Pixmap.scaled(
                         56, 56, Qt.KeepAspectRatio, Qt.SmoothTransformation
@@ -170,11 +358,25 @@ class BookCard(QFrame):
             self._CreatePlaceholder()
             
         except Exception as Error:
-            self.Logger.error(f"Failed to load cover for book {self.BookData.get('ID', 'Unknown')}: {Error}")
+            self.Logger.error(f"Failed to load cover for book {self.BookData.get('id', 'Unknown')}: {Error}")
             self._CreatePlaceholder()
     
+    def SetCover(self, Pixmap: Optional[QPixmap]) -> None:
+        """Show a cover delivered by the ThumbnailLoader, or the placeholder if decoding failed"""
+        if Pixmap is None:
+            self._CreatePlaceholder()
+        else:
+            self.CoverLabel.setPixmap(Pixmap)
+    
     def _CreatePlaceholder(self) -> None:
-        """Create a placeholder image for books without covers"""
+        """Show the placeholder image for books without (or still decoding) covers"""
+        Placeholder = BookCard._Placeholders.get(self.ViewMode)
+        if Placeholder is None:
+            Placeholder = BookCard._Placeholders[self.ViewMode] = self._PaintPlaceholder()
+        self.CoverLabel.setPixmap(Placeholder)
+    
+    def _PaintPlaceholder(self) -> QPixmap:
+        """Paint the placeholder pixmap for this card's view mode"""
         if self.ViewMode == "list":
             Placeholder = QPixmap(56, 56)
             FontSize = 8
@@ -194,12 +396,12 @@ class BookCard(QFrame):
         Painter.drawText(Placeholder.rect(), Qt.AlignCenter, Text)
         Painter.end()
         
-        self.CoverLabel.setPixmap(Placeholder)
+        return Placeholder
     
     def mousePressEvent(self, event):
         """Handle mouse click on book card"""
         if event.button() == Qt.LeftButton:
-            self.BookClicked.emit(self.BookData)
+            self.BookClicked.emit(self.BookData.get('id', -1))
         super().mousePressEvent(event)
 
 
@@ -217,17 +419,34 @@ class BookGrid(QWidget):
     BookSelected = Signal(dict)
     BookOpened = Signal(dict)
     SelectionChanged = Signal(int)
+    EndReached = Signal()  # Scrolled near the bottom of a fully built grid
+    
+    # Cards added per event-loop turn while filling the grid
+    BatchSize = 100
+    
+    # Quiet period after the last resize event before the grid is re-laid out (milliseconds)
+    ResizeDelay = 100
     
     def __init__(self, BookService: BookService):
         super().__init__()
         
-        self.Logger = logging.getLogger(__name__)
+        self.Logger = _LOGGER
         self.BookService = BookService
         
         # Current state
         self.CurrentBooks: List[Dict] = []
         self.CurrentFilters: Dict = {}
         self.BookCards: List[BookCard] = []
+        self._BooksById: Dict[int, Dict] = {}  # Resolves BookCard.BookClicked ids
+        self._SpareCards: Dict[int, BookCard] = {}  # Detached cards awaiting reuse by book id
+        self._DisplayGeneration = 0  # Bumped on every refill; stale batches stop
+        self.ThumbnailLoader = ThumbnailLoader()
+        
+        # Coalesces a resize drag into one HandleResize call; restarted per event
+        self._ResizeTimer = QTimer(self)
+        self._ResizeTimer.setSingleShot(True)
+        self._ResizeTimer.setInterval(self.ResizeDelay)
+        self._ResizeTimer.timeout.connect(self.HandleResize)
         
         # Layout settings
         self.ViewMode = "grid"
@@ -235,9 +454,8 @@ class BookGrid(QWidget):
         self.CardWidth = 180
         self.CardHeight = 280
         
-        # Initialize UI
+        # Initialize UI (MainWindow supplies the books, so none are loaded here)
         self._SetupUI()
-        self._LoadAllBooks()
         
         self.Logger.info("Book grid initialized with fixes")
     
@@ -254,6 +472,7 @@ class BookGrid(QWidget):
         self.ScrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.ScrollArea.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         MainLayout.addWidget(self.ScrollArea)
+        self.ScrollArea.verticalScrollBar().valueChanged.connect(self._OnScrolled)
         
         # Create scrollable content widget
         self.ContentWidget = QWidget()
@@ -272,52 +491,18 @@ class BookGrid(QWidget):
         self.GridLayout.setContentsMargins(10, 10, 10, 10)
         
         # Apply styling
-        self.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            
-            QScrollBar:vertical {
-                background-color: rgba(255, 255, 255, 0.1);
-                width: 16px;
-                border-radius: 8px;
-                margin: 0;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: rgba(255, 255, 255, 0.3);
-                border-radius: 8px;
-                min-height: 30px;
-                margin: 2px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: rgba(255, 255, 255, 0.5);
-            }
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-            }
-        """)
-    
-    def _LoadAllBooks(self) -> None:
-        """Load all books from the database"""
-        try:
-            if self.BookService:
-                self.CurrentBooks = self.BookService.GetAllBooks()
-                self._UpdateDisplay()
-                self.Logger.info(f"Loaded {len(self.CurrentBooks)} books")
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to load books: {Error}")
+        self.setStyleSheet(_BOOK_GRID_STYLESHEET)
     
     def _UpdateDisplay(self) -> None:
         """Update the book grid display"""
         try:
-            # Clear existing cards
-            self._ClearGrid()
+            # Cancel any fill still in progress
+            self._DisplayGeneration += 1
+            self._BooksById = {Book.get('id'): Book for Book in self.CurrentBooks}
+            
+            # Keep the cards of books that stay on screen; only the difference is rebuilt
+            self._RecycleCards()
+            self._ResetStretches()
 
             if not self.CurrentBooks:
                 self.PlaceholderLabel.setVisible(True)
@@ -328,52 +513,84 @@ class BookGrid(QWidget):
             # Calculate columns based on available width
             self._CalculateColumns()
             
-            # Add book cards to grid
-            Row, Col = 0, 0
-            for BookData in self.CurrentBooks:
-                Card = BookCard(BookData, self.ViewMode)
-                Card.BookClicked.connect(self._OnBookSelected)
-                
-                self.GridLayout.addWidget(Card, Row, Col)
-                self.BookCards.append(Card)
+            # Add book cards in batches so the first rows paint immediately
+            self._AddCardBatch(self._DisplayGeneration, 0)
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to update display: {Error}")
+    
+    def _AddCardBatch(self, Generation: int, Start: int) -> None:
+        """Add the next batch of book cards, then yield to the event loop"""
+        try:
+            if Generation != self._DisplayGeneration:
+                return  # Superseded by a newer display update
+            
+            BookCount = len(self.CurrentBooks)
+            End = min(Start + self.BatchSize, BookCount)
+            
+            for Index in range(Start, End):
+                Book = self.CurrentBooks[Index]
+                Card = self._SpareCards.pop(Book.get('id'), None)
+                if Card is None:
+                    Card = BookCard(Book, self.ViewMode, self.ThumbnailLoader)
+                    Card.BookClicked.connect(self._OnBookSelected)
+                else:
+                    Card.SetBookData(Book)
                 
                 if self.ViewMode == "list":
                     # List view: single column
-                    Row += 1
+                    Row, Col = Index, 0
                 else:
                     # Grid view: multiple columns
-                    Col += 1
-                    if Col >= self.ColumnsCount:
-                        Col = 0
-                        Row += 1
+                    Row, Col = divmod(Index, self.ColumnsCount)
+                
+                self.GridLayout.addWidget(Card, Row, Col)
+                Card.show()  # Recycled cards were hidden while detached
+                self.BookCards.append(Card)
+            
+            if End < BookCount:
+                QTimer.singleShot(0, lambda: self._AddCardBatch(Generation, End))
+                return
             
             # Add stretch to push everything to the left
             if self.ViewMode == "list":
-                self.GridLayout.setRowStretch(Row, 1)
+                self.GridLayout.setRowStretch(BookCount, 1)
             else:
+                Row, Col = divmod(BookCount, self.ColumnsCount)
                 self.GridLayout.setColumnStretch(Col + 1, 1)
                 self.GridLayout.setRowStretch(Row + 1, 1)
             
-            # Process events to update display
-            QApplication.processEvents()
-            
-            self.Logger.debug(f"Display updated with {len(self.CurrentBooks)} books in {self.ColumnsCount} columns")
+            self.Logger.debug(f"Display updated with {BookCount} books in {self.ColumnsCount} columns")
             
         except Exception as Error:
-            self.Logger.error(f"Failed to update display: {Error}")
+            self.Logger.error(f"Failed to add book cards: {Error}")
     
-    def _ClearGrid(self) -> None:
-        """Clear all widgets from the grid"""
+    def _RecycleCards(self) -> None:
+        """Detach all cards, keeping those still needed as spares and deleting the rest"""
         try:
-            # Remove all book cards
-            for Card in self.BookCards:
-                self.GridLayout.removeWidget(Card)
-                Card.deleteLater()
+            Cards = self.BookCards + list(self._SpareCards.values())
+            self.BookCards = []
+            self._SpareCards = {}
             
-            self.BookCards.clear()
+            for Card in Cards:
+                self.GridLayout.removeWidget(Card)
+                BookId = Card.BookData.get('id')
+                if (BookId in self._BooksById and Card.ViewMode == self.ViewMode
+                        and BookId not in self._SpareCards):
+                    Card.hide()
+                    self._SpareCards[BookId] = Card
+                else:
+                    Card.deleteLater()
             
         except Exception as Error:
-            self.Logger.error(f"Failed to clear grid: {Error}")
+            self.Logger.error(f"Failed to recycle cards: {Error}")
+    
+    def _ResetStretches(self) -> None:
+        """Clear the trailing row/column stretches left by the previous fill"""
+        for Row in range(self.GridLayout.rowCount()):
+            self.GridLayout.setRowStretch(Row, 0)
+        for Col in range(self.GridLayout.columnCount()):
+            self.GridLayout.setColumnStretch(Col, 0)
     
     def _CalculateColumns(self) -> None:
         """Calculate optimal number of columns based on available width"""
@@ -400,9 +617,14 @@ class BookGrid(QWidget):
             self.Logger.error(f"Failed to calculate columns: {Error}")
             self.ColumnsCount = 4  # Fallback
     
-    def _OnBookSelected(self, BookData: dict) -> None:
+    def _OnBookSelected(self, BookId: int) -> None:
         """Handle book selection"""
         try:
+            BookData = self._BooksById.get(BookId)
+            if BookData is None:
+                self.Logger.warning(f"Clicked book ID {BookId} is not displayed")
+                return
+            
             self.BookSelected.emit(BookData)
             self.BookOpened.emit(BookData)
             self.Logger.info(f"Book selected: {BookData.get('Title', 'Unknown')}")
@@ -454,13 +676,44 @@ class BookGrid(QWidget):
         super().resizeEvent(event)
         
         # Use timer to avoid too many updates during resizing
-        if hasattr(self, '_ResizeTimer'):
-            self._ResizeTimer.stop()
+        self._ResizeTimer.start()
+    
+    def _OnScrolled(self, Value: int) -> None:
+        """Emit EndReached when within two screens of the bottom"""
+        if len(self.BookCards) < len(self.CurrentBooks):
+            return  # Still filling; the pending batches will extend the grid
         
-        self._ResizeTimer = QTimer()
-        self._ResizeTimer.timeout.connect(self.HandleResize)
-        self._ResizeTimer.setSingleShot(True)
-        self._ResizeTimer.start(100)  # 100ms delay
+        ScrollBar = self.ScrollArea.verticalScrollBar()
+        if ScrollBar.maximum() > 0 and Value >= ScrollBar.maximum() - 2 * ScrollBar.pageStep():
+            self.EndReached.emit()
+    
+    def AppendBooks(self, Books: List[Dict]) -> None:
+        """Add more books after the ones already displayed"""
+        try:
+            if not Books:
+                return
+            
+            Start = len(self.CurrentBooks)
+            Filling = len(self.BookCards) < Start
+            self.CurrentBooks = self.CurrentBooks + Books
+            self._BooksById.update((Book.get('id'), Book) for Book in Books)
+            
+            if Filling:
+                return  # The running batch chain picks up the new books
+            
+            # Clear the trailing stretch set by the previous fill
+            if self.ViewMode == "list":
+                self.GridLayout.setRowStretch(Start, 0)
+            else:
+                Row, Col = divmod(Start, self.ColumnsCount)
+                self.GridLayout.setColumnStretch(Col + 1, 0)
+                self.GridLayout.setRowStretch(Row + 1, 0)
+            
+            self._AddCardBatch(self._DisplayGeneration, Start)
+            self.Logger.info(f"Appended {len(Books)} books for display")
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to append books: {Error}")
     
     def GetBookCount(self) -> int:
         """Get the current number of displayed books"""
@@ -498,13 +751,4 @@ class BookGrid(QWidget):
                 self.Logger.info(f"View mode set to: {Mode}")
             
         except Exception as Error:
-            self.Logger.error(f"Failed to set view mode: {Error}")
-    
-    def RefreshDisplay(self) -> None:
-        """Refresh the entire display"""
-        try:
-            self._LoadAllBooks()
-            self.Logger.info("Book grid display refreshed")
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to refresh display: {Error}")
\ No newline at end of file
+            self.Logger.error(f"Failed to set view mode: {Error}")
\ No newline at end of file
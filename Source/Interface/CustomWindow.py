@@ -48,6 +48,7 @@ class CustomWindow(QMainWindow):
 
         self.setMouseTracking(True)
         self.resize_origin = QPoint()
+        self.screen_size = None  # Available screen size, queried once per resize drag
 
     def get_content_widget(self):
         return self.centralWidget()
@@ -72,7 +73,9 @@ class CustomWindow(QMainWindow):
             new_width = self.width() + delta.x()
             new_height = self.height() + delta.y()
 
-            screen_size = QApplication.primaryScreen().availableSize()
+            if self.screen_size is None:
+                self.screen_size = QApplication.primaryScreen().availableSize()
+            screen_size = self.screen_size
             new_x = self.x() + new_width
             new_y = self.y() + new_height
 
@@ -86,6 +89,7 @@ class CustomWindow(QMainWindow):
 
         if event.type() == QEvent.MouseButtonRelease:
             self.resize_origin = None
+            self.screen_size = None
 
         return super().event(event)
 
@@ -2,7 +2,7 @@
 # Path: Source/Interface/FilterPanel.py
 # Standard: AIDEV-PascalCase-1.8
 # Created: 2025-07-06
-# Last Modified: 2025-07-06  02:57PM
+# Last Modified: 2026-10-17  03:16PM
 """
 Description: Filter Panel for Anderson's Library - Left Sidebar Interface
 Provides search and filtering interface for book library navigation.
@@ -19,7 +19,6 @@ Features:
 Dependencies:
 - PySide6: Qt framework for GUI components
 - Source.Core.BookService: Business logic for filtering
-- Source.Data.DatabaseModels: Data models and search criteria
 - logging: Application logging
 
 Architecture:
@@ -35,13 +34,102 @@ from typing import List, Dict, Any, Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QComboBox, QPushButton, QFrame, QGroupBox, QSpinBox,
-    QCheckBox, QSlider, QTextEdit, QScrollArea
+    QTextEdit, QScrollArea
 )
 from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont, QPalette, QIcon
 
 from Source.Core.BookService import BookService
-from Source.Data.DatabaseModels import SearchCriteria
+
+_LOGGER = logging.getLogger("FilterPanel")
+
+
+# Filter panel stylesheet, built once at import and shared by every instance
+_FILTER_PANEL_STYLESHEET = """
+QGroupBox {
+    font-weight: bold;
+    border: 2px solid #555555;
+    border-radius: 8px;
+    margin-top: 8px;
+    padding-top: 8px;
+    background-color: #3c3c3c;
+    color: #ffffff;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 8px 0 8px;
+    color: #0078d4;
+    font-size: 10pt;
+}
+
+QLabel {
+    color: #ffffff;
+    font-size: 9pt;
+}
+
+QLineEdit {
+    background-color: #2b2b2b;
+    border: 2px solid #555555;
+    border-radius: 6px;
+    padding: 6px;
+    color: #ffffff;
+    font-size: 9pt;
+}
+
+QLineEdit:focus {
+    border-color: #0078d4;
+}
+
+QComboBox {
+    background-color: #2b2b2b;
+    border: 2px solid #555555;
+    border-radius: 6px;
+    padding: 6px;
+    color: #ffffff;
+    font-size: 9pt;
+}
+
+QComboBox:focus {
+    border-color: #0078d4;
+}
+
+QComboBox::drop-down {
+    border: none;
+    width: 20px;
+}
+
+QComboBox QAbstractItemView {
+    background-color: #3c3c3c;
+    color: #ffffff;
+    selection-background-color: #0078d4;
+    border: 1px solid #555555;
+}
+
+QPushButton {
+    background-color: #4a4a4a;
+    color: #ffffff;
+    border: 2px solid #555555;
+    border-radius: 6px;
+    padding: 8px 16px;
+    font-weight: 500;
+    font-size: 9pt;
+}
+
+QPushButton:hover {
+    background-color: #5a5a5a;
+}
+
+QPushButton:pressed {
+    background-color: #3a3a3a;
+}
+
+QPushButton:disabled {
+    background-color: #555555;
+    color: #888888;
+}
+"""
 
 
 class FilterPanel(QWidget):
@@ -51,13 +139,12 @@ class FilterPanel(QWidget):
     Provides intuitive interface for:
     - Category and subject hierarchical filtering
     - Text search across multiple fields
-    - Advanced filtering options
     - Filter state management
     """
     
     # Signals for communication with main window
     FiltersChanged = Signal(dict)  # Emitted when any filter changes
-    SearchRequested = Signal(str)  # Emitted when search is performed
+    SearchRequested = Signal(str)  # Emitted with the stripped, non-empty search term
     CategoryChanged = Signal(str)  # Emitted when category selection changes
     SubjectChanged = Signal(str)  # Emitted when subject selection changes
     ViewModeChanged = Signal(str) # Emitted when the view mode changes
@@ -75,7 +162,7 @@ class FilterPanel(QWidget):
         
         # Core dependencies
         self.BookService = BookService
-        self.Logger = logging.getLogger(self.__class__.__name__)
+        self.Logger = _LOGGER
         
         # UI components
         self.SearchLineEdit: Optional[QLineEdit] = None
@@ -83,9 +170,6 @@ class FilterPanel(QWidget):
         self.SubjectComboBox: Optional[QComboBox] = None
         self.ResetButton: Optional[QPushButton] = None
         self.SearchButton: Optional[QPushButton] = None
-        self.RatingSlider: Optional[QSlider] = None
-        self.RatingLabel: Optional[QLabel] = None
-        self.ThumbnailCheckBox: Optional[QCheckBox] = None
         
         # State management
         self.CurrentCategory: str = ""
@@ -98,9 +182,10 @@ class FilterPanel(QWidget):
         self.SearchTimer.setSingleShot(True)
         self.SearchTimer.timeout.connect(self.PerformSearch)
         
-        # Initialize UI
+        # Initialize UI; the category query runs once the event loop starts,
+        # so it does not hold up the window's first paint
         self.InitializeUI()
-        self.LoadInitialData()
+        QTimer.singleShot(0, self.LoadInitialData)
         self.ConnectSignals()
         self.ApplyStyles()
         
@@ -232,13 +317,13 @@ class FilterPanel(QWidget):
         try:
             self.IsUpdatingUI = True
             
-            # Load categories
+            # Load categories in one insert, without a currentTextChanged per item
             Categories = self.BookService.GetCategories()
             if self.CategoryComboBox:
+                self.CategoryComboBox.blockSignals(True)
                 self.CategoryComboBox.clear()
-                self.CategoryComboBox.addItem("All Categories")
-                for Category in Categories:
-                    self.CategoryComboBox.addItem(Category)
+                self.CategoryComboBox.addItems(["All Categories", *Categories])
+                self.CategoryComboBox.blockSignals(False)
             
             self.IsUpdatingUI = False
             
@@ -246,6 +331,8 @@ class FilterPanel(QWidget):
             
         except Exception as Error:
             self.Logger.error(f"Failed to load initial data: {Error}")
+            if self.CategoryComboBox:
+                self.CategoryComboBox.blockSignals(False)
             self.IsUpdatingUI = False
     
     def ConnectSignals(self) -> None:
@@ -265,13 +352,6 @@ class FilterPanel(QWidget):
             
             if self.SubjectComboBox:
                 self.SubjectComboBox.currentTextChanged.connect(self.OnSubjectChanged)
-            
-            # Advanced filter signals
-            if self.RatingSlider:
-                self.RatingSlider.valueChanged.connect(self.OnRatingChanged)
-            
-            if self.ThumbnailCheckBox:
-                self.ThumbnailCheckBox.stateChanged.connect(self.OnThumbnailFilterChanged)
 
             if self.GridButton:
                 self.GridButton.clicked.connect(lambda: self.ViewModeChanged.emit("grid"))
@@ -287,136 +367,7 @@ class FilterPanel(QWidget):
     def ApplyStyles(self) -> None:
         """Apply custom styles to the filter panel."""
         try:
-            self.setStyleSheet("""
-                QGroupBox {
-                    font-weight: bold;
-                    border: 2px solid #555555;
-                    border-radius: 8px;
-                    margin-top: 8px;
-                    padding-top: 8px;
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                }
-                
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 8px 0 8px;
-                    color: #0078d4;
-                    font-size: 10pt;
-                }
-                
-                QLabel {
-                    color: #ffffff;
-                    font-size: 9pt;
-                }
-                
-                QLineEdit {
-                    background-color: #2b2b2b;
-                    border: 2px solid #555555;
-                    border-radius: 6px;
-                    padding: 6px;
-                    color: #ffffff;
-                    font-size: 9pt;
-                }
-                
-                QLineEdit:focus {
-                    border-color: #0078d4;
-                }
-                
-                QComboBox {
-                    background-color: #2b2b2b;
-                    border: 2px solid #555555;
-                    border-radius: 6px;
-                    padding: 6px;
-                    color: #ffffff;
-                    font-size: 9pt;
-                }
-                
-                QComboBox:focus {
-                    border-color: #0078d4;
-                }
-                
-                QComboBox::drop-down {
-                    border: none;
-                    width: 20px;
-                }
-                
-                QComboBox::down-arrow {
-                    image: url(down_arrow.png);
-                    width: 12px;
-                    height: 12px;
-                }
-                
-                QComboBox QAbstractItemView {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    selection-background-color: #0078d4;
-                    border: 1px solid #555555;
-                }
-                
-                QPushButton {
-                    background-color: #4a4a4a;
-                    color: #ffffff;
-                    border: 2px solid #555555;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                    font-weight: 500;
-                    font-size: 9pt;
-                }
-                
-                QPushButton:hover {
-                    background-color: #5a5a5a;
-                }
-                
-                QPushButton:pressed {
-                    background-color: #3a3a3a;
-                }
-                
-                QPushButton:disabled {
-                    background-color: #555555;
-                    color: #888888;
-                }
-                
-                QSlider::groove:horizontal {
-                    border: 1px solid #555555;
-                    height: 6px;
-                    background: #2b2b2b;
-                    border-radius: 3px;
-                }
-                
-                QSlider::handle:horizontal {
-                    background: #0078d4;
-                    border: 1px solid #0078d4;
-                    width: 16px;
-                    height: 16px;
-                    border-radius: 8px;
-                    margin: -5px 0;
-                }
-                
-                QSlider::handle:horizontal:hover {
-                    background: #106ebe;
-                    border-color: #106ebe;
-                }
-                
-                QCheckBox {
-                    color: #ffffff;
-                    font-size: 9pt;
-                }
-                
-                QCheckBox::indicator {
-                    width: 16px;
-                    height: 16px;
-                    border: 2px solid #555555;
-                    border-radius: 3px;
-                    background-color: #2b2b2b;
-                }
-                
-                QCheckBox::indicator:checked {
-                    background-color: #0078d4;
-                    border-color: #0078d4;
-                }
-            """)
+            self.setStyleSheet(_FILTER_PANEL_STYLESHEET)
             
             self.Logger.debug("Styles applied successfully")
             
@@ -511,27 +462,6 @@ class FilterPanel(QWidget):
         except Exception as Error:
             self.Logger.error(f"Failed to handle subject change: {Error}")
     
-    def OnRatingChanged(self, Rating: int) -> None:
-        """Handle rating slider change."""
-        try:
-            if self.RatingLabel:
-                self.RatingLabel.setText(str(Rating))
-            
-            if not self.IsUpdatingUI:
-                self.EmitFiltersChanged()
-                
-        except Exception as Error:
-            self.Logger.error(f"Failed to handle rating change: {Error}")
-    
-    def OnThumbnailFilterChanged(self, State: int) -> None:
-        """Handle thumbnail filter checkbox change."""
-        try:
-            if not self.IsUpdatingUI:
-                self.EmitFiltersChanged()
-                
-        except Exception as Error:
-            self.Logger.error(f"Failed to handle thumbnail filter change: {Error}")
-    
     def UpdateSubjects(self, Category: str) -> None:
         """Update subjects dropdown based on selected category."""
         try:
@@ -540,16 +470,14 @@ class FilterPanel(QWidget):
             
             self.IsUpdatingUI = True
             
-            # Clear current subjects
+            # Replace the subjects in one insert, without a currentTextChanged per item
+            Subjects = self.BookService.GetSubjectsForCategory(Category) if Category else []
+            self.SubjectComboBox.blockSignals(True)
             self.SubjectComboBox.clear()
-            self.SubjectComboBox.addItem("All Subjects")
+            self.SubjectComboBox.addItems(["All Subjects", *Subjects])
+            self.SubjectComboBox.blockSignals(False)
             
             if Category:
-                # Load subjects for category
-                Subjects = self.BookService.GetSubjectsForCategory(Category)
-                for Subject in Subjects:
-                    self.SubjectComboBox.addItem(Subject)
-                
                 self.SubjectComboBox.setEnabled(True)
                 self.Logger.debug(f"Loaded {len(Subjects)} subjects for category '{Category}'")
             else:
@@ -564,6 +492,7 @@ class FilterPanel(QWidget):
             
         except Exception as Error:
             self.Logger.error(f"Failed to update subjects: {Error}")
+            self.SubjectComboBox.blockSignals(False)
             self.IsUpdatingUI = False
     
     def ClearSearch(self) -> None:
@@ -603,14 +532,6 @@ class FilterPanel(QWidget):
             if self.CurrentSubject:
                 Criteria['Subject'] = self.CurrentSubject
             
-            # Rating filter
-            if self.RatingSlider and self.RatingSlider.value() > 0:
-                Criteria['MinRating'] = self.RatingSlider.value()
-            
-            # Thumbnail filter
-            if self.ThumbnailCheckBox and self.ThumbnailCheckBox.isChecked():
-                Criteria['HasThumbnail'] = True
-            
             return Criteria
             
         except Exception as Error:
@@ -664,16 +585,6 @@ class FilterPanel(QWidget):
                     self.SubjectComboBox.setCurrentIndex(Index)
             self.CurrentSubject = Subject
             
-            # Set rating
-            MinRating = Criteria.get('MinRating', 0)
-            if self.RatingSlider:
-                self.RatingSlider.setValue(MinRating)
-            
-            # Set thumbnail filter
-            HasThumbnail = Criteria.get('HasThumbnail', False)
-            if self.ThumbnailCheckBox:
-                self.ThumbnailCheckBox.setChecked(HasThumbnail)
-            
             self.IsUpdatingUI = False
             
             self.Logger.debug(f"Set filter criteria: {Criteria}")
@@ -2,7 +2,7 @@
 # Path: Source/Interface/MainWindow.py
 # Standard: AIDEV-PascalCase-1.8
 # Created: 2025-07-06
-# Last Modified: 2025-07-06  03:42PM
+# Last Modified: 2026-10-17  03:53PM
 """
 Description: Main Application Window for Anderson's Library - FIXED PySide6 Imports
 Orchestrates all UI components and provides the main application interface.
@@ -23,26 +23,67 @@ Dependencies:
 - Source.Core.BookService: Business logic
 - Source.Interface.FilterPanel: Left sidebar filters
 - Source.Interface.BookGrid: Main book display
+- Source.Utils.BackgroundTask: Off-GUI-thread execution of blocking work
 - logging: Application logging
+
+Threading:
+- Blocking I/O (database queries, file checks) runs on QThreadPool via
+  BackgroundTask and reports back through queued signals.
+- Do not wrap blocking calls in asyncio on top of the Qt loop (qasync);
+  its selector wakeups keep a core busy while idle (qasync issue #28).
 """
 
 import sys
+import time
 import logging
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import List, Dict, Any, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, 
-    QFrame, QStatusBar, QMessageBox, QSplitter, QMenuBar, QMenu,
+    QFrame, QStatusBar, QMessageBox, QMenuBar, QMenu,
     QProgressBar, QLabel, QToolBar, QPushButton
 )
-from PySide6.QtCore import Qt, QTimer, Signal  # ✅ FIXED: Signal not pyqtSignal
-from PySide6.QtGui import QFont, QIcon, QAction, QPixmap
+from PySide6.QtCore import Qt, QTimer, QThreadPool, QUrl, Signal  # ✅ FIXED: Signal not pyqtSignal
+from PySide6.QtGui import (
+    QFont, QIcon, QAction, QPixmap, QDesktopServices, QBrush, QColor,
+    QGradient, QLinearGradient, QPalette
+)
 
 from Source.Core.DatabaseManager import DatabaseManager
 from Source.Core.BookService import BookService
 from Source.Interface.FilterPanel import FilterPanel
 from Source.Interface.BookGrid import BookGrid
 from Source.Utils.AboutDialog import AboutDialog
+from Source.Utils.BackgroundTask import BackgroundTask
+
+_LOGGER = logging.getLogger("MainWindow")
+
+
+# Vertical window gradient (position, RGB), painted once as the window's palette brush
+_WINDOW_GRADIENT_STOPS = (
+    (0.00480769, (3, 50, 76)),
+    (0.293269, (6, 82, 125)),
+    (0.514423, (8, 117, 178)),
+    (0.745192, (7, 108, 164)),
+    (1.0, (3, 51, 77)),
+)
+
+# Status bar message templates (%-formatted per event)
+_STATUS_ALL_BOOKS = "Showing all books: %d books"
+_STATUS_FILTERED = "Filtered (%s): %d books"
+_STATUS_SEARCHING = "Searching for '%s'..."
+_STATUS_OPENED = "Opened: %s"
+_STATUS_SELECTED = "%d books selected"
+_STATUS_VIEW_MODE = "View mode: %s"
+
+# Status bar library counts (categories, subjects in dropdown, total eBooks)
+_DATABASE_STATS_TEMPLATE = (
+    '<span style="color: #FFFFFF;">%d</span> <span style="color: #FFFF00;">Categories</span>&nbsp;&nbsp;'
+    '<span style="color: #FFFFFF;">%d</span> <span style="color: #FFFF00;">Subjects</span>&nbsp;&nbsp;'
+    '<span style="color: #FFFFFF;">%d</span> <span style="color: #FFFF00;">Total eBooks</span>'
+)
 
 
 class MainWindow(QMainWindow):
@@ -53,17 +94,45 @@ class MainWindow(QMainWindow):
     Handles application lifecycle, event routing, and user interactions.
     """
     
+    # Book query cache limits (entries and seconds)
+    QueryCacheSize = 64
+    QueryCacheTTL = 300.0
+    
+    # Books fetched per page for the unfiltered "all books" view
+    PageSize = 500
+    
+    # Delay before queued last-opened timestamps are written (milliseconds)
+    LastOpenedFlushDelay = 500
+    
+    # Delay that coalesces rapid filter/search requests into one query (milliseconds);
+    # long enough to absorb a burst of combo box changes such as arrowing through
+    # categories. Typed search text is already debounced by FilterPanel
+    SearchDelay = 200
+    
+    # Library database opened at startup
+    DatabasePath = "Data/Databases/MyLibrary.db"
+    
+    # Theme font and palette, built by the first window and shared by later ones
+    _ThemeFont: Optional[QFont] = None
+    _ThemePalette: Optional[QPalette] = None
+    
     # ✅ FIXED: Using Signal instead of pyqtSignal
     BookSelected = Signal(dict)  # Emitted when a book is selected
     FiltersChanged = Signal(dict)  # Emitted when filters change
     StatusUpdated = Signal(str)  # Emitted when status should update
     
-    def __init__(self):
-        """Initialize the main window and all components."""
+    def __init__(self, DatabaseFuture: Optional["Future[DatabaseManager]"] = None):
+        """
+        Initialize the main window and all components.
+        
+        Args:
+            DatabaseFuture: DatabaseManager already being opened off the GUI
+                thread; when omitted the database is opened here
+        """
         super().__init__()
         
         # Setup logging
-        self.Logger = logging.getLogger(self.__class__.__name__)
+        self.Logger = _LOGGER
         
         # Core components
         self.DatabaseManager: Optional[DatabaseManager] = None
@@ -73,18 +142,46 @@ class MainWindow(QMainWindow):
         self.FilterPanel: Optional[FilterPanel] = None
         self.BookGrid: Optional[BookGrid] = None
         self.CentralWidget: Optional[QWidget] = None
-        self.MainSplitter: Optional[QSplitter] = None
         self.StatusBar: Optional[QStatusBar] = None
         self.ProgressBar: Optional[QProgressBar] = None
         self.StatusLabel: Optional[QLabel] = None
+        self.DatabaseStatsLabel: Optional[QLabel] = None
         
         # State management
         self.CurrentBooks: List[Dict[str, Any]] = []
         self.IsLoading: bool = False
+        self._LastStatusMessage: str = ""  # Skips repaints for unchanged status text
         self.LastFilterCriteria: Dict[str, Any] = {}
+        self._NextPageOffset: Optional[int] = None  # None when the view is complete
+        self._QueryEpoch: int = 0  # Bumped per query; stale background results are dropped
+        self._PageEpoch: Optional[int] = None  # Epoch of the page fetch in flight, if any
+        
+        # Library counts for the status bar, loaded on the thread pool
+        self._DatabaseStats: Optional[Dict[str, int]] = None
+        self._DatabaseStatsPending: bool = False
+        
+        # Book query cache: (SearchTerm, Category, Subject) -> (Timestamp, Books)
+        self._QueryCache: "OrderedDict[Tuple[str, str, str], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        
+        # Pre-resolved category/subject filters (book ids only), built in the
+        # background at startup; the matching rows are fetched per query
+        self._FilterIndex: Optional[Dict[str, Dict[str, List[int]]]] = None
+        self._FilterIndexEpoch: int = 0
+        
+        # Coalesces filter/search requests; only the latest criteria are applied
+        self._PendingCriteria: Dict[str, Any] = {}
+        self._SearchTimer = QTimer(self)
+        self._SearchTimer.setSingleShot(True)
+        self._SearchTimer.setInterval(self.SearchDelay)
+        self._SearchTimer.timeout.connect(self._RunPendingSearch)
+        
+        # Batches last-opened writes from consecutive book opens
+        self._LastOpenedFlushTimer = QTimer(self)
+        self._LastOpenedFlushTimer.setSingleShot(True)
+        self._LastOpenedFlushTimer.timeout.connect(self.FlushLastOpened)
         
         # Initialize application
-        self.InitializeComponents()
+        self.InitializeComponents(DatabaseFuture)
         self.SetupUI()
         self.ApplyTheme()
         self.ConnectSignals()
@@ -92,11 +189,14 @@ class MainWindow(QMainWindow):
         
         self.Logger.info("MainWindow initialized successfully")
     
-    def InitializeComponents(self) -> None:
+    def InitializeComponents(self, DatabaseFuture: Optional["Future[DatabaseManager]"] = None) -> None:
         """Initialize core application components."""
         try:
-            # Initialize database manager
-            self.DatabaseManager = DatabaseManager("Data/Databases/MyLibrary.db")
+            # Initialize database manager (waiting for the background open if one was started)
+            if DatabaseFuture is not None:
+                self.DatabaseManager = DatabaseFuture.result()
+            else:
+                self.DatabaseManager = DatabaseManager.Instance(self.DatabasePath)
             
             # Connect to database
             if not self.DatabaseManager.Connect():
@@ -132,27 +232,19 @@ class MainWindow(QMainWindow):
             self.CentralWidget = QWidget()
             self.setCentralWidget(self.CentralWidget)
             
-            # Create main layout with splitter
+            # Create main layout: fixed-width filter panel, book grid takes the rest
             MainLayout = QHBoxLayout(self.CentralWidget)
             MainLayout.setContentsMargins(8, 8, 8, 8)
             MainLayout.setSpacing(8)
             
-            # Create splitter for resizable panels
-            self.MainSplitter = QSplitter(Qt.Orientation.Horizontal)
-            MainLayout.addWidget(self.MainSplitter)
-            
             # Add filter panel (left side)
             if self.FilterPanel:
-                self.FilterPanel.setMaximumWidth(350)
-                self.FilterPanel.setMinimumWidth(250)
-                self.MainSplitter.addWidget(self.FilterPanel)
+                self.FilterPanel.setFixedWidth(300)
+                MainLayout.addWidget(self.FilterPanel, 0)
             
             # Add book grid (right side)
             if self.BookGrid:
-                self.MainSplitter.addWidget(self.BookGrid)
-            
-            # Set splitter proportions (25% filter, 75% books)
-            self.MainSplitter.setSizes([300, 1200])
+                MainLayout.addWidget(self.BookGrid, 1)
             
             # Create status bar
             self.CreateStatusBar()
@@ -256,6 +348,7 @@ class MainWindow(QMainWindow):
             self.BookGrid.BookSelected.connect(self.OnBookSelected)
             self.BookGrid.BookOpened.connect(self.OnBookOpened)
             self.BookGrid.SelectionChanged.connect(self.OnSelectionChanged)
+            self.BookGrid.EndReached.connect(self.FetchNextPage)
             
             # Internal signals
             self.StatusUpdated.connect(self.UpdateStatusBar)
@@ -270,115 +363,28 @@ class MainWindow(QMainWindow):
     def ApplyTheme(self) -> None:
         """Apply the application theme and styling."""
         try:
-            # Set application font
-            Font = QFont("Segoe UI", 9)
-            self.setFont(Font)
-            
-            # Apply modern dark theme
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: qlineargradient(
-                        spread:repeat, x1:1, y1:0, x2:1, y2:1, 
-                        stop:0.00480769 rgba(3, 50, 76, 255), 
-                        stop:0.293269 rgba(6, 82, 125, 255), 
-                        stop:0.514423 rgba(8, 117, 178, 255), 
-                        stop:0.745192 rgba(7, 108, 164, 255), 
-                        stop:1 rgba(3, 51, 77, 255)
-                    );
-                    color: #ffffff;
-                }
-                
-                QMenuBar {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    border: none;
-                    padding: 4px;
-                }
-                
-                QMenuBar::item {
-                    background-color: transparent;
-                    padding: 6px 12px;
-                    border-radius: 4px;
-                }
-                
-                QMenuBar::item:selected {
-                    background-color: #0078d4;
-                }
-                
-                QMenu {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 4px;
-                }
-                
-                QMenu::item {
-                    padding: 6px 20px;
-                    border-radius: 4px;
-                }
-                
-                QMenu::item:selected {
-                    background-color: #0078d4;
-                }
-                
-                QToolBar {
-                    background-color: #3c3c3c;
-                    border: none;
-                    spacing: 4px;
-                    padding: 4px;
-                }
-                
-                QPushButton {
-                    background-color: #0078d4;
-                    color: #ffffff;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    font-weight: 500;
-                }
-                
-                QPushButton:hover {
-                    background-color: #106ebe;
-                }
-                
-                QPushButton:pressed {
-                    background-color: #005a9e;
-                }
-                
-                QStatusBar {
-                    background-color: #FF0000;
-                    color: #ffffff;
-                    border-top: 1px solid #555555;
-                }
+            Cls = type(self)
+            if Cls._ThemePalette is None:
+                # Paint the background gradient as a single palette fill; children stay
+                # transparent so it is not redrawn per widget by the stylesheet engine
+                Gradient = QLinearGradient(0, 0, 0, 1)
+                Gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+                Gradient.setSpread(QGradient.RepeatSpread)
+                for Position, (Red, Green, Blue) in _WINDOW_GRADIENT_STOPS:
+                    Gradient.setColorAt(Position, QColor(Red, Green, Blue))
                 
-                QProgressBar {
-                    border: 1px solid #555555;
-                    border-radius: 4px;
-                    text-align: center;
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                
-                QProgressBar::chunk {
-                    background-color: #0078d4;
-                    border-radius: 3px;
-                }
-                
-                QSplitter::handle {
-                    background-color: #555555;
-                    width: 2px;
-                }
-                
-                QSplitter::handle:hover {
-                    background-color: #0078d4;
-                }
-                QToolTip { 
-                    color: #ffffff; 
-                    background-color: #3c3c3c; 
-                    border: 1px solid #555555; 
-                    font-size: 16px; 
-                }
-            """)
+                WindowPalette = self.palette()
+                WindowPalette.setBrush(QPalette.Window, QBrush(Gradient))
+                Cls._ThemeFont = QFont("Segoe UI", 9)
+                Cls._ThemePalette = WindowPalette
+            
+            # Set application font and background
+            self.setFont(Cls._ThemeFont)
+            self.setPalette(Cls._ThemePalette)
+            self.setAutoFillBackground(True)
+            
+            # The stylesheet itself (Assets/AndersonLibrary.qss) is applied once
+            # to the QApplication at startup rather than re-parsed per window
             
             self.Logger.debug("Theme applied successfully")
             
@@ -391,7 +397,10 @@ class MainWindow(QMainWindow):
             # Force re-parsing of this method
             if self.BookGrid:
                 self.BookGrid.SetBooks([])
-            self.UpdateDatabaseStats()
+            self.BuildFilterIndex()
+            
+            # The stats query runs on the thread pool so the window paints first
+            self.LoadDatabaseStats()
             
         except Exception as Error:
             self.Logger.error(f"Failed to load initial data: {Error}")
@@ -405,20 +414,8 @@ class MainWindow(QMainWindow):
                 self.Logger.error("BookService not available")
                 return
             
-            # Get all books
-            self.CurrentBooks = self.BookService.GetAllBooks()
-            
-            # Update book grid
-            if self.BookGrid:
-                self.BookGrid.SetBooks(self.CurrentBooks)
-            
-            # Update status
-            BookCount = len(self.CurrentBooks)
-            self.UpdateStatusBar(f"Showing all books: {BookCount} books")
-            self.UpdateDatabaseStats()
-            
-            self.HideProgress()
-            self.Logger.info(f"Loaded {BookCount} books successfully")
+            # Same path as an empty filter, so an older in-flight query cannot overwrite it
+            self.ApplyFilters({})
             
         except Exception as Error:
             self.Logger.error(f"Failed to load books: {Error}")
@@ -433,7 +430,7 @@ class MainWindow(QMainWindow):
             self.LastFilterCriteria = Criteria
             
             self.ShowProgress("Filtering books...")
-            QTimer.singleShot(50, lambda: self.ApplyFilters(Criteria))
+            self._QueueSearch(Criteria)
             
         except Exception as Error:
             self.Logger.error(f"Failed to handle filter change: {Error}")
@@ -445,59 +442,274 @@ class MainWindow(QMainWindow):
             if not self.BookService:
                 return
             
+            # Any query still running on the thread pool is now out of date
+            self._QueryEpoch += 1
+            self._NextPageOffset = None
+            
             # Extract filter criteria
             Category = Criteria.get('Category', '')
             Subject = Criteria.get('Subject', '')
             SearchTerm = Criteria.get('SearchTerm', '')
             
-            # Get filtered books
+            # Serve from the query cache where possible; the filter index narrows
+            # a category/subject query to a fetch by id
+            Service = self.BookService
+            FilteredBooks = None
             if SearchTerm:
-                FilteredBooks = self.BookService.SearchBooks(SearchTerm)
+                Key = (SearchTerm.lower(), '', '')
+                Loader = lambda: Service.SearchBooks(SearchTerm)
             elif Category or Subject:
-                FilteredBooks = self.BookService.GetBooksByFilters(Category, Subject)
+                Key = ('', Category, Subject)
+                BookIds = self._LookupFilterIndex(Category, Subject)
+                if BookIds is None:
+                    Loader = lambda: Service.GetBooksByFilters(Category, Subject)
+                elif BookIds:
+                    Loader = lambda: Service.GetBooksByIds(BookIds)
+                else:
+                    FilteredBooks = []  # Nothing matches; no query needed
             else:
-                FilteredBooks = self.BookService.GetAllBooks()
+                # First page of all books; the rest loads as the grid scrolls
+                Key = ('', '', '')
+                PageSize = self.PageSize
+                Loader = lambda: Service.GetAllBooks(Limit=PageSize)
+            
+            if FilteredBooks is None:
+                FilteredBooks = self._CacheLookup(Key)
+            
+            if FilteredBooks is not None:
+                self._ApplyBooks(Criteria, Key, FilteredBooks)
+                return
+            
+            # Otherwise query on the thread pool and apply the result in OnBooksLoaded
+            Epoch = self._QueryEpoch
+            Task = BackgroundTask(lambda: (Epoch, Criteria, Key, Loader()))
+            Task.Signals.Finished.connect(self.OnBooksLoaded)
+            Task.Signals.Failed.connect(self.OnBooksLoadFailed)
+            QThreadPool.globalInstance().start(Task)
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to apply filters: {Error}")
+            self.HideProgress()
+            self.UpdateStatusBar("Filter operation failed")
+    
+    def OnBooksLoaded(self, Result: Tuple[int, Dict[str, Any], Tuple[str, str, str], List[Dict[str, Any]]]) -> None:
+        """Cache a background query result and show it unless a newer query was issued."""
+        try:
+            Epoch, Criteria, Key, Books = Result
+            self._CacheStore(Key, Books)
+            
+            if Epoch != self._QueryEpoch:
+                return  # Superseded while running
+            
+            self._ApplyBooks(Criteria, Key, Books)
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to apply loaded books: {Error}")
+            self.HideProgress()
+    
+    def OnBooksLoadFailed(self, Message: str) -> None:
+        """Report an unexpected error raised by a background book query."""
+        self.Logger.error(f"Book query failed: {Message}")
+        self.HideProgress()
+        self.UpdateStatusBar("Filter operation failed")
+    
+    def _ApplyBooks(self, Criteria: Dict[str, Any], Key: Tuple[str, str, str],
+                    Books: List[Dict[str, Any]]) -> None:
+        """
+        Show a query result in the grid and status bar.
+        
+        Args:
+            Criteria: Filter criteria the books were fetched for
+            Key: Query cache key of the result
+            Books: Books to display
+        """
+        try:
+            self.CurrentBooks = Books
+            ResultCount = len(Books)
             
-            # Update current books
-            self.CurrentBooks = FilteredBooks
+            if Key == ('', '', '') and len(Books) == self.PageSize:
+                # Partial first page: arm paging and report the library total once known
+                self._NextPageOffset = len(Books)
+                if self._DatabaseStats is not None:
+                    ResultCount = self._DatabaseStats.get('Books', ResultCount)
             
             # Update book grid
             if self.BookGrid:
                 self.BookGrid.SetBooks(self.CurrentBooks)
             
-            # Update status
-            self.UpdateFilterStatus(Criteria, len(FilteredBooks))
+            # Update status (after HideProgress, which lifts the IsLoading guard)
             self.HideProgress()
+            self.UpdateFilterStatus(Criteria, ResultCount)
             self.UpdateDatabaseStats()
             
-            self.Logger.debug(f"Applied filters, showing {len(FilteredBooks)} books")
+            self.Logger.debug(f"Applied filters, showing {len(Books)} books")
             
         except Exception as Error:
-            self.Logger.error(f"Failed to apply filters: {Error}")
+            self.Logger.error(f"Failed to show books: {Error}")
             self.HideProgress()
             self.UpdateStatusBar("Filter operation failed")
     
+    def FetchNextPage(self) -> None:
+        """Append the next page of all books when the grid nears its end."""
+        try:
+            if self._NextPageOffset is None or not self.BookService:
+                return
+            
+            if self._PageEpoch == self._QueryEpoch:
+                return  # This view already has a page on the way
+            
+            # Query on the thread pool and append the page in OnPageLoaded
+            Epoch = self._QueryEpoch
+            Offset = self._NextPageOffset
+            PageSize = self.PageSize
+            Service = self.BookService
+            Task = BackgroundTask(lambda: (Epoch, Offset, Service.GetAllBooks(Limit=PageSize, Offset=Offset)))
+            Task.Signals.Finished.connect(self.OnPageLoaded)
+            Task.Signals.Failed.connect(self.OnPageLoadFailed)
+            self._PageEpoch = Epoch
+            QThreadPool.globalInstance().start(Task)
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to fetch more books: {Error}")
+            self._PageEpoch = None
+            self._NextPageOffset = None
+    
+    def OnPageLoaded(self, Result: Tuple[int, int, List[Dict[str, Any]]]) -> None:
+        """Append a background page fetch unless a newer query replaced the view."""
+        try:
+            Epoch, Offset, Page = Result
+            if Epoch != self._QueryEpoch:
+                return  # Superseded while running
+            
+            self._PageEpoch = None
+            self._NextPageOffset = Offset + len(Page) if len(Page) == self.PageSize else None
+            
+            self.CurrentBooks = self.CurrentBooks + Page
+            if self.BookGrid:
+                self.BookGrid.AppendBooks(Page)
+            
+            self.Logger.debug(f"Fetched {len(Page)} more books at offset {Offset}")
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to append more books: {Error}")
+            self._NextPageOffset = None
+    
+    def OnPageLoadFailed(self, Message: str) -> None:
+        """Stop paging after an unexpected error raised by a background page fetch."""
+        self.Logger.error(f"Page query failed: {Message}")
+        self._PageEpoch = None
+        self._NextPageOffset = None
+    
+    def _CacheLookup(self, Key: Tuple[str, str, str]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return books for a (SearchTerm, Category, Subject) key from the query cache.
+        
+        Args:
+            Key: Normalized query key
+            
+        Returns:
+            List of Book dictionaries, or None if missing or expired
+        """
+        Entry = self._QueryCache.get(Key)
+        if Entry is None or time.monotonic() - Entry[0] >= self.QueryCacheTTL:
+            return None
+        
+        self._QueryCache.move_to_end(Key)
+        return Entry[1]
+    
+    def _CacheStore(self, Key: Tuple[str, str, str], Books: List[Dict[str, Any]]) -> None:
+        """Store a query result, evicting the least recently used entries."""
+        self._QueryCache[Key] = (time.monotonic(), Books)
+        self._QueryCache.move_to_end(Key)
+        while len(self._QueryCache) > self.QueryCacheSize:
+            self._QueryCache.popitem(last=False)
+    
+    def InvalidateQueryCache(self) -> None:
+        """Drop all cached book queries so the next view re-reads the database."""
+        self._QueryCache.clear()
+        self._FilterIndex = None
+        self._FilterIndexEpoch += 1
+    
+    def BuildFilterIndex(self) -> None:
+        """Build the category/subject filter index on the thread pool."""
+        try:
+            if not self.DatabaseManager or not self.BookService:
+                return
+            
+            Manager = self.DatabaseManager
+            Epoch = self._FilterIndexEpoch
+            Task = BackgroundTask(lambda: (Epoch, Manager.GetCategorySubjectIndex()))
+            Task.Signals.Finished.connect(self.OnFilterIndexReady)
+            QThreadPool.globalInstance().start(Task)
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to start filter index build: {Error}")
+    
+    def OnFilterIndexReady(self, Result: Tuple[int, Dict[str, Dict[str, List[int]]]]) -> None:
+        """Store a finished filter index unless the cache was invalidated meanwhile."""
+        Epoch, Index = Result
+        if Epoch != self._FilterIndexEpoch:
+            return
+        
+        self._FilterIndex = Index
+        self.Logger.debug(f"Filter index ready: {len(Index)} categories")
+    
+    def _LookupFilterIndex(self, Category: str, Subject: str) -> Optional[List[int]]:
+        """
+        Resolve a category/subject filter to book ids from the in-memory index.
+        
+        Args:
+            Category: Category name, or empty for all categories
+            Subject: Subject name, or empty for all subjects
+            
+        Returns:
+            Sorted ids of the matching books, or None if the index is not ready
+        """
+        if self._FilterIndex is None:
+            return None
+        
+        SubjectMaps = [self._FilterIndex.get(Category, {})] if Category else self._FilterIndex.values()
+        BookIds = set()
+        for SubjectMap in SubjectMaps:
+            if Subject:
+                BookIds.update(SubjectMap.get(Subject, ()))
+            else:
+                for Ids in SubjectMap.values():
+                    BookIds.update(Ids)
+        
+        return sorted(BookIds)
+    
     def OnSearchRequested(self, SearchTerm: str) -> None:
-        """Handle search request from filter panel."""
+        """Handle search request from filter panel (the term arrives already stripped)."""
         try:
-            if not SearchTerm.strip():
+            if not SearchTerm:
+                self._SearchTimer.stop()
                 self.LoadAllBooks()
                 return
             
-            self.ShowProgress(f"Searching for '{SearchTerm}'...")
-            Criteria = {'SearchTerm': SearchTerm}
-            QTimer.singleShot(50, lambda: self.ApplyFilters(Criteria))
+            self.ShowProgress(_STATUS_SEARCHING % SearchTerm)
+            self._QueueSearch({'SearchTerm': SearchTerm})
             
         except Exception as Error:
             self.Logger.error(f"Failed to handle search request: {Error}")
             self.HideProgress()
     
+    def _QueueSearch(self, Criteria: Dict[str, Any]) -> None:
+        """Schedule ApplyFilters, replacing any request still waiting on the timer."""
+        self._PendingCriteria = Criteria
+        self._SearchTimer.start()  # Restarts if already running
+    
+    def _RunPendingSearch(self) -> None:
+        """Apply the most recent queued criteria."""
+        self.ApplyFilters(self._PendingCriteria)
+    
     def OnResetRequested(self) -> None:
         """Handle reset request from filter panel."""
         try:
             self.ShowProgress("Resetting filters...")
             self.LastFilterCriteria = {}
-            QTimer.singleShot(50, self.LoadAllBooks)
+            self._SearchTimer.stop()  # Drop any search still waiting to run
+            self.LoadAllBooks()  # Queries off the GUI thread; no need to defer
             
         except Exception as Error:
             self.Logger.error(f"Failed to handle reset request: {Error}")
@@ -519,16 +731,67 @@ class MainWindow(QMainWindow):
             self.Logger.info(f"Opening book: {BookTitle}")
             
             if self.BookService:
-                Success = self.BookService.OpenBook(BookTitle)
-                if Success:
-                    self.UpdateStatusBar(f"Opened: {BookTitle}")
-                else:
-                    self.ShowError(f"Failed to open book: {BookTitle}")
+                # Open by primary key when the grid supplied one; titles need a search
+                BookIdentifier = Book.get('id') or BookTitle
+                
+                # Lookup and file check can block (database, network drives),
+                # so run them on the thread pool and launch the viewer from here
+                Service = self.BookService
+                Task = BackgroundTask(lambda: (BookTitle, Service.ResolveBookFile(BookIdentifier)))
+                Task.Signals.Finished.connect(self.OnBookResolved)
+                Task.Signals.Failed.connect(self.OnBookOpenFailed)
+                QThreadPool.globalInstance().start(Task)
             
         except Exception as Error:
             self.Logger.error(f"Failed to handle book opening: {Error}")
             self.ShowError(f"Failed to open book: {Error}")
     
+    def OnBookResolved(self, Outcome: Tuple[str, Optional[Dict[str, Any]]]) -> None:
+        """Launch the viewer for a book resolved in the background."""
+        try:
+            BookTitle, BookData = Outcome
+            if not BookData:
+                self.ShowError(f"Failed to open book: {BookTitle}")
+                return
+            
+            # Qt hands the file to the desktop's own asynchronous opener;
+            # fall back to the platform command if no handler accepts it
+            FilePath = BookData['FilePath']
+            Opened = QDesktopServices.openUrl(QUrl.fromLocalFile(FilePath))
+            if not Opened:
+                Opened = self.BookService.LaunchFile(FilePath)
+            
+            if not Opened:
+                self.ShowError(f"Failed to open book: {BookTitle}")
+                return
+            
+            # Queue the last_opened write; batch it with any further opens
+            self.BookService.MarkOpened(BookData)
+            self._LastOpenedFlushTimer.start(self.LastOpenedFlushDelay)
+            self.UpdateStatusBar(_STATUS_OPENED % BookTitle)
+                
+        except Exception as Error:
+            self.Logger.error(f"Failed to report book opening: {Error}")
+    
+    def OnBookOpenFailed(self, Message: str) -> None:
+        """Report an unexpected error raised by a background book open."""
+        self.ShowError(f"Failed to open book: {Message}")
+    
+    def FlushLastOpened(self) -> None:
+        """Write queued last-opened timestamps on the thread pool."""
+        if not self.BookService:
+            return
+        
+        Task = BackgroundTask(self.BookService.FlushLastOpened)
+        Task.Signals.Finished.connect(self.OnLastOpenedFlushed)
+        QThreadPool.globalInstance().start(Task)
+    
+    def OnLastOpenedFlushed(self, Count: int) -> None:
+        """Drop cached rows once their last_opened values have changed."""
+        if Count:
+            self.InvalidateQueryCache()
+            self.BuildFilterIndex()
+    
     def OnSelectionChanged(self, Count: int) -> None:
         """Handle selection change in book grid."""
         try:
@@ -537,7 +800,7 @@ class MainWindow(QMainWindow):
             elif Count == 1:
                 self.UpdateStatusBar("1 book selected")
             else:
-                self.UpdateStatusBar(f"{Count} books selected")
+                self.UpdateStatusBar(_STATUS_SELECTED % Count)
                 
         except Exception as Error:
             self.Logger.error(f"Failed to handle selection change: {Error}")
@@ -548,8 +811,12 @@ class MainWindow(QMainWindow):
             self.Logger.info("Refreshing library")
             
             # Clear caches
+            self.InvalidateQueryCache()
+            self._DatabaseStats = None
             if self.BookService:
                 self.BookService.ClearCache()
+            if self.BookGrid:
+                self.BookGrid.ThumbnailLoader.Clear()
             
             # Refresh filter panel
             if self.FilterPanel:
@@ -557,6 +824,7 @@ class MainWindow(QMainWindow):
             
             # Reload books
             self.LoadAllBooks()
+            self.BuildFilterIndex()
             
         except Exception as Error:
             self.Logger.error(f"Failed to refresh library: {Error}")
@@ -567,7 +835,7 @@ class MainWindow(QMainWindow):
         try:
             if self.BookGrid:
                 self.BookGrid.SetViewMode(Mode)
-                self.UpdateStatusBar(f"View mode: {Mode}")
+                self.UpdateStatusBar(_STATUS_VIEW_MODE % Mode)
                 
         except Exception as Error:
             self.Logger.error(f"Failed to set view mode: {Error}")
@@ -605,7 +873,7 @@ Current Display: {len(self.CurrentBooks)} books"""
         """Update status bar with filter information."""
         try:
             if not Criteria:
-                self.UpdateStatusBar(f"Showing all books: {ResultCount} books")
+                self.UpdateStatusBar(_STATUS_ALL_BOOKS % ResultCount)
                 return
             
             FilterParts = []
@@ -619,9 +887,9 @@ Current Display: {len(self.CurrentBooks)} books"""
             
             if FilterParts:
                 FilterText = " | ".join(FilterParts)
-                self.UpdateStatusBar(f"Filtered ({FilterText}): {ResultCount} books")
+                self.UpdateStatusBar(_STATUS_FILTERED % (FilterText, ResultCount))
             else:
-                self.UpdateStatusBar(f"Showing all books: {ResultCount} books")
+                self.UpdateStatusBar(_STATUS_ALL_BOOKS % ResultCount)
                 
         except Exception as Error:
             self.Logger.error(f"Failed to update filter status: {Error}")
@@ -629,10 +897,13 @@ Current Display: {len(self.CurrentBooks)} books"""
     def UpdateDatabaseStats(self) -> None:
         """Update database statistics in status bar."""
         try:
-            if not self.BookService or not hasattr(self, 'DatabaseStatsLabel'):
+            if not self.BookService or not self.DatabaseStatsLabel:
                 return
             
-            Stats = self.BookService.GetDatabaseStats()
+            Stats = self._DatabaseStats
+            if Stats is None:
+                self.LoadDatabaseStats()  # Shown from OnDatabaseStatsLoaded
+                return
             
             TotalBooksCount = Stats.get('Books', 0) # Total books in DB
             DisplayedBooksCount = len(self.CurrentBooks) # Books currently displayed
@@ -642,23 +913,63 @@ Current Display: {len(self.CurrentBooks)} books"""
             if self.FilterPanel and self.FilterPanel.SubjectComboBox:
                 SubjectsInDropdown = self.FilterPanel.SubjectComboBox.count() - 1 # Exclude "All Subjects"
 
-            # Determine which total to display
-            if DisplayedBooksCount > 0:
+            # Determine which total to display (a paged view shows the library total)
+            if DisplayedBooksCount > 0 and self._NextPageOffset is None:
                 DisplayTotal = DisplayedBooksCount
             else:
                 DisplayTotal = TotalBooksCount
 
-            StatsText = f"<span style=\"color: #FFFFFF;\">{Stats.get('Categories', 0)}</span> <span style=\"color: #FFFF00;\">Categories</span>&nbsp;&nbsp;<span style=\"color: #FFFFFF;\">{SubjectsInDropdown}</span> <span style=\"color: #FFFF00;\">Subjects</span>&nbsp;&nbsp;<span style=\"color: #FFFFFF;\">{DisplayTotal}</span> <span style=\"color: #FFFF00;\">Total eBooks</span>"
-            self.DatabaseStatsLabel.setText(StatsText)
+            StatsText = _DATABASE_STATS_TEMPLATE % (Stats.get('Categories', 0), SubjectsInDropdown, DisplayTotal)
+            if StatsText != self.DatabaseStatsLabel.text():
+                self.DatabaseStatsLabel.setText(StatsText)
             
         except Exception as Error:
             self.Logger.error(f"Failed to update database stats: {Error}")
     
+    def LoadDatabaseStats(self) -> None:
+        """Fetch the library counts on the thread pool for the status bar."""
+        try:
+            if not self.BookService or self._DatabaseStatsPending:
+                return
+            
+            Epoch = self._QueryEpoch
+            Service = self.BookService
+            Task = BackgroundTask(lambda: (Epoch, Service.GetDatabaseStats()))
+            Task.Signals.Finished.connect(self.OnDatabaseStatsLoaded)
+            Task.Signals.Failed.connect(self.OnDatabaseStatsFailed)
+            self._DatabaseStatsPending = True
+            QThreadPool.globalInstance().start(Task)
+            
+        except Exception as Error:
+            self._DatabaseStatsPending = False
+            self.Logger.error(f"Failed to load database stats: {Error}")
+    
+    def OnDatabaseStatsLoaded(self, Result: Tuple[int, Dict[str, int]]) -> None:
+        """Store the library counts and refresh the status bar with them."""
+        try:
+            Epoch, Stats = Result
+            self._DatabaseStatsPending = False
+            self._DatabaseStats = Stats
+            self.UpdateDatabaseStats()
+            
+            # A paged all-books view still shows its page size as the result count
+            if Epoch == self._QueryEpoch and self._NextPageOffset is not None:
+                self.UpdateFilterStatus({}, Stats.get('Books', len(self.CurrentBooks)))
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to apply database stats: {Error}")
+    
+    def OnDatabaseStatsFailed(self, Message: str) -> None:
+        """Report an unexpected error raised by the background stats query."""
+        self._DatabaseStatsPending = False
+        self.Logger.error(f"Database stats query failed: {Message}")
+    
     def ShowProgress(self, Message: str) -> None:
         """Show progress indication."""
         try:
             if self.ProgressBar and self.StatusLabel:
                 self.StatusLabel.setText(Message)
+                self._LastStatusMessage = Message
                 self.ProgressBar.setVisible(True)
                 self.ProgressBar.setRange(0, 0)  # Indeterminate progress
                 self.IsLoading = True
@@ -679,8 +990,9 @@ Current Display: {len(self.CurrentBooks)} books"""
     def UpdateStatusBar(self, Message: str) -> None:
         """Update status bar message."""
         try:
-            if self.StatusLabel and not self.IsLoading:
+            if self.StatusLabel and not self.IsLoading and Message != self._LastStatusMessage:
                 self.StatusLabel.setText(Message)
+                self._LastStatusMessage = Message
                 
         except Exception as Error:
             self.Logger.error(f"Failed to update status bar: {Error}")
@@ -706,6 +1018,7 @@ Current Display: {len(self.CurrentBooks)} books"""
         """Handle application close event."""
         try:
             self.Logger.info("Application closing")
+            self.InvalidateQueryCache()
             
             # Close database connection
             if self.DatabaseManager:
@@ -2,7 +2,7 @@
 # Path: Source/Utils/AboutDialog.py
 # Standard: AIDEV-PascalCase-1.8
 # Created: 2025-07-06
-# Last Modified: 2025-07-06  08:00PM
+# Last Modified: 2026-10-17  03:16PM
 """
 Description: About Dialog for Anderson's Library.
 Displays application information and branding.
@@ -14,12 +14,20 @@ from PySide6.QtCore import Qt, QEvent, QPoint
 from pathlib import Path
 import logging
 
+_LOGGER = logging.getLogger("AboutDialog")
+
+# Branding logo shown in the dialog
+_LOGO_PATH = Path(__file__).parent.parent.parent / "Assets" / "BowersWorld.png"
+
 
 class AboutDialog(QDialog):
+    # Scaled logo, loaded by the first dialog and reused by later ones
+    _LogoPixmap = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self.Logger = logging.getLogger(self.__class__.__name__)
+        self.Logger = _LOGGER
 
         # self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
 
@@ -31,10 +39,12 @@ class AboutDialog(QDialog):
         self.label.setStyleSheet("color: #ffd200; font: bold 24px; text-align: center;")
         self.label.setAlignment(Qt.AlignCenter)
 
-        pixmap = QPixmap(str(Path(__file__).parent.parent.parent / "Assets" / "BowersWorld.png"))
-        if pixmap.isNull():
-            self.Logger.warning(f"Failed to load BowersWorld.png from {Path(__file__).parent.parent.parent / 'Assets' / 'BowersWorld.png'}")
-        pixmap = pixmap.scaled(170, 170, Qt.KeepAspectRatio)
+        if AboutDialog._LogoPixmap is None:
+            pixmap = QPixmap(str(_LOGO_PATH))
+            if pixmap.isNull():
+                self.Logger.warning(f"Failed to load BowersWorld.png from {_LOGO_PATH}")
+            AboutDialog._LogoPixmap = pixmap.scaled(170, 170, Qt.KeepAspectRatio)
+        pixmap = AboutDialog._LogoPixmap
 
         self.icon_label = QLabel()
         self.icon_label.setPixmap(pixmap)
@@ -0,0 +1,66 @@
+# File: BackgroundTask.py
+# Path: Source/Utils/BackgroundTask.py
+# Standard: AIDEV-PascalCase-1.8
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  03:16PM
+"""
+Description: Background Task Runner for Anderson's Library
+Runs blocking work (database queries, launching external viewers) on Qt's
+global thread pool and reports the result back to the GUI thread through
+queued signals, keeping the event loop responsive.
+"""
+
+import logging
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+# One logger for every task rather than a lookup per task
+_LOGGER = logging.getLogger("BackgroundTask")
+
+
+class BackgroundTaskSignals(QObject):
+    """
+    Signals emitted by a BackgroundTask.
+
+    QRunnable is not a QObject and cannot emit signals itself, so each task
+    carries one of these companions. It is created on the GUI thread, which
+    makes every connection to a GUI-thread receiver a queued connection.
+    """
+
+    Finished = Signal(object)  # Emitted with the callable's return value
+    Failed = Signal(str)  # Emitted with the error message if the callable raised
+
+
+class BackgroundTask(QRunnable):
+    """
+    Run a blocking callable on a QThreadPool worker thread.
+
+    Connect Finished/Failed to bound methods of GUI-thread QObjects so the
+    handlers run on the GUI thread, then submit with
+    QThreadPool.globalInstance().start(Task).
+    """
+
+    def __init__(self, Function: Callable[[], Any]):
+        """
+        Initialize the task.
+
+        Args:
+            Function: Zero-argument callable executed on the worker thread
+        """
+        super().__init__()
+
+        self.Function = Function
+        self.Signals = BackgroundTaskSignals()
+        self.Logger = _LOGGER
+
+    def run(self) -> None:
+        """Execute the callable and report its outcome."""
+        try:
+            Result = self.Function()
+        except Exception as Error:
+            self.Logger.error(f"Background task failed: {Error}")
+            self.Signals.Failed.emit(str(Error))
+            return
+
+        self.Signals.Finished.emit(Result)
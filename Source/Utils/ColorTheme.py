@@ -2,21 +2,116 @@
 # Path: Source/Utils/ColorTheme.py
 # Standard: AIDEV-PascalCase-1.8
 # Created: 2025-07-05
-# Last Modified: 2025-07-05  08:30PM
+# Last Modified: 2026-10-17  03:13PM
 """
 Description: Enhanced Color Theme Module with Better Contrast
 Provides professional color schemes with improved readability and contrast.
 """
 
+from types import MappingProxyType
+
 from PySide6.QtGui import QColor, QPalette
 from PySide6.QtCore import QObject
 
 
+# Theme color tables, built once at import and shared read-only by every caller
+_PROFESSIONAL_THEME = MappingProxyType({
+    # Main Window Colors
+    'MainBackground': '#f5f5f5',          # Light gray main background
+    'WindowBorder': '#2c3e50',            # Dark blue-gray border
+    
+    # Left Panel Colors (High Contrast)
+    'PanelBackground': '#34495e',         # Dark blue-gray background
+    'PanelText': '#ffffff',               # Pure white text for maximum contrast
+    'PanelTextSecondary': '#ecf0f1',      # Very light gray for secondary text
+    'PanelBorder': '#2c3e50',             # Darker border
+    
+    # Input Field Colors  
+    'InputBackground': '#ffffff',         # White input background
+    'InputBorder': '#bdc3c7',             # Light gray border
+    'InputText': '#2c3e50',               # Dark text
+    'InputFocus': '#3498db',              # Blue focus border
+    
+    # Button Colors
+    'ButtonBackground': '#3498db',        # Blue button background
+    'ButtonText': '#ffffff',              # White button text
+    'ButtonHover': '#2980b9',             # Darker blue on hover
+    'ButtonPressed': '#21618c',           # Even darker when pressed
+    
+    # Book Card Colors
+    'CardBackground': '#ffffff',          # White card background
+    'CardBorder': '#e1e8ed',              # Light gray border
+    'CardText': '#2c3e50',                # Dark text
+    'CardHover': '#f8f9fa',               # Very light gray on hover
+    'CardShadow': 'rgba(0, 0, 0, 0.1)',   # Subtle shadow
+    
+    # Status Bar Colors
+    'StatusBackground': '#ecf0f1',        # Light gray background
+    'StatusText': '#2c3e50',              # Dark text
+    'StatusBorder': '#bdc3c7',            # Light border
+    
+    # Accent Colors
+    'Primary': '#3498db',                 # Primary blue
+    'Success': '#27ae60',                 # Green for success
+    'Warning': '#f39c12',                 # Orange for warnings
+    'Error': '#e74c3c',                   # Red for errors
+    'Info': '#17a2b8',                    # Teal for info
+})
+
+_DARK_THEME = MappingProxyType({
+    # Main Window Colors
+    'MainBackground': '#2c3e50',
+    'WindowBorder': '#34495e',
+    
+    # Left Panel Colors
+    'PanelBackground': '#34495e',
+    'PanelText': '#ecf0f1',
+    'PanelTextSecondary': '#bdc3c7',
+    'PanelBorder': '#2c3e50',
+    
+    # Input Field Colors
+    'InputBackground': '#34495e',
+    'InputBorder': '#7f8c8d',
+    'InputText': '#ecf0f1',
+    'InputFocus': '#3498db',
+    
+    # Button Colors
+    'ButtonBackground': '#3498db',
+    'ButtonText': '#ffffff',
+    'ButtonHover': '#2980b9',
+    'ButtonPressed': '#21618c',
+    
+    # Book Card Colors
+    'CardBackground': '#34495e',
+    'CardBorder': '#7f8c8d',
+    'CardText': '#ecf0f1',
+    'CardHover': '#2c3e50',
+    'CardShadow': 'rgba(0, 0, 0, 0.3)',
+    
+    # Status Bar Colors
+    'StatusBackground': '#2c3e50',
+    'StatusText': '#ecf0f1',
+    'StatusBorder': '#34495e',
+    
+    # Accent Colors
+    'Primary': '#3498db',
+    'Success': '#27ae60',
+    'Warning': '#f39c12',
+    'Error': '#e74c3c',
+    'Info': '#17a2b8',
+})
+
+_THEMES = {"Professional": _PROFESSIONAL_THEME, "Dark": _DARK_THEME}
+
+
 class ColorTheme(QObject):
     """
     Enhanced color theme manager for Anderson's Library with improved contrast.
     """
     
+    # Generated stylesheets by theme name, shared by every ColorTheme instance
+    _StyleSheetCache = {}
+    
     def __init__(self):
         super().__init__()
         self.CurrentTheme = "Professional"
@@ -26,96 +121,14 @@ class ColorTheme(QObject):
         """
         Professional theme with high contrast for better readability.
         """
-        return {
-            # Main Window Colors
-            'MainBackground': '#f5f5f5',          # Light gray main background
-            'WindowBorder': '#2c3e50',            # Dark blue-gray border
-            
-            # Left Panel Colors (High Contrast)
-            'PanelBackground': '#34495e',         # Dark blue-gray background
-            'PanelText': '#ffffff',               # Pure white text for maximum contrast
-            'PanelTextSecondary': '#ecf0f1',      # Very light gray for secondary text
-            'PanelBorder': '#2c3e50',             # Darker border
-            
-            # Input Field Colors  
-            'InputBackground': '#ffffff',         # White input background
-            'InputBorder': '#bdc3c7',             # Light gray border
-            'InputText': '#2c3e50',               # Dark text
-            'InputFocus': '#3498db',              # Blue focus border
-            
-            # Button Colors
-            'ButtonBackground': '#3498db',        # Blue button background
-            'ButtonText': '#ffffff',              # White button text
-            'ButtonHover': '#2980b9',             # Darker blue on hover
-            'ButtonPressed': '#21618c',           # Even darker when pressed
-            
-            # Book Card Colors
-            'CardBackground': '#ffffff',          # White card background
-            'CardBorder': '#e1e8ed',              # Light gray border
-            'CardText': '#2c3e50',                # Dark text
-            'CardHover': '#f8f9fa',               # Very light gray on hover
-            'CardShadow': 'rgba(0, 0, 0, 0.1)',   # Subtle shadow
-            
-            # Status Bar Colors
-            'StatusBackground': '#ecf0f1',        # Light gray background
-            'StatusText': '#2c3e50',              # Dark text
-            'StatusBorder': '#bdc3c7',            # Light border
-            
-            # Accent Colors
-            'Primary': '#3498db',                 # Primary blue
-            'Success': '#27ae60',                 # Green for success
-            'Warning': '#f39c12',                 # Orange for warnings
-            'Error': '#e74c3c',                   # Red for errors
-            'Info': '#17a2b8',                    # Teal for info
-        }
+        return _PROFESSIONAL_THEME
     
     @staticmethod
     def GetDarkTheme():
         """
         Dark theme with high contrast.
         """
-        return {
-            # Main Window Colors
-            'MainBackground': '#2c3e50',
-            'WindowBorder': '#34495e',
-            
-            # Left Panel Colors
-            'PanelBackground': '#34495e',
-            'PanelText': '#ecf0f1',
-            'PanelTextSecondary': '#bdc3c7',
-            'PanelBorder': '#2c3e50',
-            
-            # Input Field Colors
-            'InputBackground': '#34495e',
-            'InputBorder': '#7f8c8d',
-            'InputText': '#ecf0f1',
-            'InputFocus': '#3498db',
-            
-            # Button Colors
-            'ButtonBackground': '#3498db',
-            'ButtonText': '#ffffff',
-            'ButtonHover': '#2980b9',
-            'ButtonPressed': '#21618c',
-            
-            # Book Card Colors
-            'CardBackground': '#34495e',
-            'CardBorder': '#7f8c8d',
-            'CardText': '#ecf0f1',
-            'CardHover': '#2c3e50',
-            'CardShadow': 'rgba(0, 0, 0, 0.3)',
-            
-            # Status Bar Colors
-            'StatusBackground': '#2c3e50',
-            'StatusText': '#ecf0f1',
-            'StatusBorder': '#34495e',
-            
-            # Accent Colors
-            'Primary': '#3498db',
-            'Success': '#27ae60',
-            'Warning': '#f39c12',
-            'Error': '#e74c3c',
-            'Info': '#17a2b8',
-        }
+        return _DARK_THEME
     
     def GetTheme(self, ThemeName="Professional"):
         """
@@ -127,12 +140,7 @@ class ColorTheme(QObject):
         Returns:
             Dictionary of color values
         """
-        if ThemeName == "Professional":
-            return self.GetProfessionalTheme()
-        elif ThemeName == "Dark":
-            return self.GetDarkTheme()
-        else:
-            return self.GetProfessionalTheme()  # Default to professional
+        return _THEMES.get(ThemeName, _PROFESSIONAL_THEME)  # Default to professional
     
     def GetStyleSheet(self, ThemeName="Professional"):
         """
@@ -144,8 +152,25 @@ class ColorTheme(QObject):
         Returns:
             Complete CSS stylesheet string
         """
-        Colors = self.GetTheme(ThemeName)
+        if ThemeName not in _THEMES:
+            ThemeName = "Professional"  # Default to professional
         
+        StyleSheet = ColorTheme._StyleSheetCache.get(ThemeName)
+        if StyleSheet is None:
+            StyleSheet = ColorTheme._StyleSheetCache[ThemeName] = self._BuildStyleSheet(self.GetTheme(ThemeName))
+        return StyleSheet
+    
+    @staticmethod
+    def _BuildStyleSheet(Colors):
+        """
+        Format the stylesheet template with a theme's colors.
+        
+        Args:
+            Colors: Dictionary of color values
+            
+        Returns:
+            Complete CSS stylesheet string
+        """
         return f"""
         /* Main Window Styling */
         QMainWindow {{
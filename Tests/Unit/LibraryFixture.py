@@ -0,0 +1,115 @@
+# File: LibraryFixture.py
+# Path: Tests/Unit/LibraryFixture.py
+# Standard: AIDEV-PascalCase-1.8
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  03:56PM
+"""
+Description: Small Library Database for Unit Tests
+Builds a throwaway SQLite file with the production categories/subjects/books
+schema and a handful of books, including ones with no subject, a subject id
+that points nowhere, and no category.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+_SCHEMA = (
+    """CREATE TABLE categories (
+           id INTEGER PRIMARY KEY,
+           category TEXT NOT NULL UNIQUE
+       )""",
+    """CREATE TABLE subjects (
+           id INTEGER PRIMARY KEY,
+           category_id INTEGER,
+           subject TEXT NOT NULL,
+           UNIQUE(category_id, subject),
+           FOREIGN KEY(category_id) REFERENCES categories(id)
+       )""",
+    """CREATE TABLE books (
+           id INTEGER PRIMARY KEY,
+           title TEXT NOT NULL,
+           category_id INTEGER,
+           subject_id INTEGER,
+           author TEXT,
+           FilePath TEXT,
+           ThumbnailImage BLOB,
+           last_opened TEXT,
+           LastOpened TEXT,
+           Rating INTEGER DEFAULT 0,
+           Notes TEXT,
+           FileSize INTEGER,
+           PageCount INTEGER,
+           CreatedBy TEXT DEFAULT 'System',
+           LastModifiedBy TEXT DEFAULT 'System',
+           FOREIGN KEY(category_id) REFERENCES categories(id),
+           FOREIGN KEY(subject_id) REFERENCES subjects(id)
+       )""",
+    "CREATE INDEX idx_books_title ON books (title)",
+)
+
+CATEGORIES: Dict[int, str] = {
+    1: "Programming",
+    2: "Science",
+    3: "Empty Category",
+}
+
+# id -> (category id, subject name)
+SUBJECTS: Dict[int, Tuple[int, str]] = {
+    10: (1, "Python"),
+    11: (1, "C Languages"),
+    20: (2, "Biology"),
+    21: (2, "Physics"),
+}
+
+# (id, title, category id, subject id, author, rating)
+BOOKS: List[Tuple[int, str, Optional[int], Optional[int], Optional[str], Optional[int]]] = [
+    (1, "Python Crash Course", 1, 10, "Eric Matthes", 5),
+    (2, "Fluent Python", 1, 10, "Luciano Ramalho", 4),
+    (3, "The C Programming Language", 1, 11, "Kernighan and Ritchie", 5),
+    (4, "C* Notes", 1, 11, "Anonymous", None),
+    (5, "Cell Biology", 2, 20, "Alberts", 3),
+    (6, "Feynman Lectures", 2, 21, "Richard Feynman", 5),
+    (7, "Untitled Programming Notes", 1, None, None, 1),  # No subject
+    (8, "Orphaned Physics", 2, 99, "Somebody", 2),  # Subject id points nowhere
+    (9, "Loose Leaf", None, None, "Nobody", 0),  # No category either
+]
+
+# Small stand-in for a thumbnail BLOB
+THUMBNAIL = b"\x89PNG" + b"\x00" * 60
+
+
+def CreateLibraryDatabase(DatabasePath: Path) -> Path:
+    """
+    Create the test library at DatabasePath.
+
+    Args:
+        DatabasePath: File to create; must not exist yet
+
+    Returns:
+        DatabasePath, for chaining
+    """
+    Connection = sqlite3.connect(DatabasePath)
+    try:
+        with Connection:
+            for Sql in _SCHEMA:
+                Connection.execute(Sql)
+            Connection.executemany("INSERT INTO categories (id, category) VALUES (?, ?)",
+                                   CATEGORIES.items())
+            Connection.executemany("INSERT INTO subjects (id, category_id, subject) VALUES (?, ?, ?)",
+                                   [(Id, CategoryId, Subject) for Id, (CategoryId, Subject) in SUBJECTS.items()])
+            Connection.executemany(
+                "INSERT INTO books (id, title, category_id, subject_id, author, FilePath, ThumbnailImage, Rating)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(Id, Title, CategoryId, SubjectId, Author, f"/library/{Id}.pdf", THUMBNAIL, Rating)
+                 for Id, Title, CategoryId, SubjectId, Author, Rating in BOOKS],
+            )
+    finally:
+        Connection.close()
+    return DatabasePath
+
+
+def TitlesInOrder(BookIds) -> List[str]:
+    """Titles of the given fixture book ids, sorted the way queries order them."""
+    Titles = {Id: Title for Id, Title, *_ in BOOKS}
+    return sorted(Titles[Id] for Id in BookIds)
@@ -0,0 +1,149 @@
+# File: test_BookGrid.py
+# Path: Tests/Unit/test_BookGrid.py
+# Standard: AIDEV-PascalCase-1.8
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  03:55PM
+"""
+Description: Unit Tests for BookGrid
+Drives the grid on Qt's offscreen platform: cards are reused across display
+updates and redraw their title and cover when the book record changed.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QBuffer, QIODevice, Qt
+from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QApplication
+
+from Source.Interface.BookGrid import BookGrid, ThumbnailLoader
+
+
+def setUpModule():
+    global _APPLICATION
+    _APPLICATION = QApplication.instance() or QApplication([])
+
+
+def MakeCover(Color: str) -> bytes:
+    """PNG bytes of a solid-colour cover."""
+    Image = QImage(40, 50, QImage.Format_RGB32)
+    Image.fill(QColor(Color))
+    Buffer = QBuffer()
+    Buffer.open(QIODevice.WriteOnly)
+    Image.save(Buffer, "PNG")
+    return bytes(Buffer.data())
+
+
+def MakeBook(BookId: int, Title: str, Cover: bytes) -> dict:
+    return {'id': BookId, 'Title': Title, 'Author': 'Author', 'Category': 'General',
+            'Subject': 'General', 'FilePath': '', 'ThumbnailData': Cover,
+            'LastOpened': None, 'Rating': 0, 'Notes': ''}
+
+
+class TestCardRecycling(unittest.TestCase):
+    """BookGrid keeps the cards of books that stay on screen."""
+
+    def setUp(self):
+        self.Grid = BookGrid(None)
+        self.Red = MakeCover("#ff0000")
+        self.Blue = MakeCover("#0000ff")
+
+    def tearDown(self):
+        self.Grid.deleteLater()
+        QApplication.processEvents()
+
+    def WaitFor(self, Condition, Timeout: float = 5.0) -> bool:
+        """Process events until Condition() holds (covers decode on the thread pool)."""
+        Deadline = time.monotonic() + Timeout
+        while not Condition():
+            if time.monotonic() > Deadline:
+                return False
+            QApplication.processEvents()
+            time.sleep(0.01)
+        return True
+
+    def CoverColor(self, Card) -> QColor:
+        Image = Card.CoverLabel.pixmap().toImage()
+        if Image.isNull():
+            return QColor()
+        return Image.pixelColor(Image.width() // 2, Image.height() // 2)
+
+    def test_CardsAreReusedForBooksStillShown(self):
+        self.Grid.SetBooks([MakeBook(1, "First", self.Red), MakeBook(2, "Second", self.Red)])
+        Card = self.Grid.BookCards[1]
+        self.Grid.SetBooks([MakeBook(2, "Second", self.Red), MakeBook(3, "Third", self.Red)])
+        self.assertIs(self.Grid.BookCards[0], Card)
+
+    def test_RecycledCardShowsChangedTitleAndCover(self):
+        self.Grid.SetBooks([MakeBook(1, "Old Title", self.Red)])
+        Card = self.Grid.BookCards[0]
+        self.assertTrue(self.WaitFor(lambda: self.CoverColor(Card) == QColor("#ff0000")))
+
+        # As after Refresh Library: caches dropped, then the updated record shown
+        self.Grid.ThumbnailLoader.Clear()
+        Updated = MakeBook(1, "New Title", self.Blue)
+        self.Grid.SetBooks([Updated])
+
+        self.assertIs(self.Grid.BookCards[0], Card)
+        self.assertIs(Card.BookData, Updated)
+        self.assertEqual(Card.TitleLabel.text(), "New Title")
+        self.assertTrue(self.WaitFor(lambda: self.CoverColor(Card) == QColor("#0000ff")))
+
+    def test_PlaceholderShowsWhileCoverDecodes(self):
+        self.Grid.SetBooks([MakeBook(1, "Title", self.Red)])
+        Card = self.Grid.BookCards[0]
+        Image = Card.CoverLabel.pixmap().toImage()  # No events processed: decode pending
+        self.assertFalse(Image.isNull())
+        self.assertEqual(Image.pixelColor(1, 1), QColor("#E0E0E0"))
+        self.assertTrue(self.WaitFor(lambda: self.CoverColor(Card) == QColor("#ff0000")))
+
+    def test_UnchangedCardIsNotRedrawn(self):
+        self.Grid.SetBooks([MakeBook(1, "Title", self.Red)])
+        Card = self.Grid.BookCards[0]
+        self.assertTrue(self.WaitFor(lambda: self.CoverColor(Card) == QColor("#ff0000")))
+        CoverKey = Card.CoverLabel.pixmap().cacheKey()
+
+        self.Grid.SetBooks([MakeBook(1, "Title", self.Red)])
+        self.assertEqual(Card.CoverLabel.pixmap().cacheKey(), CoverKey)
+
+
+class TestCoverFiles(unittest.TestCase):
+    """Books without a thumbnail BLOB fall back to Data/Covers/<id>.jpg."""
+
+    def setUp(self):
+        self.TempDir = tempfile.TemporaryDirectory()
+        CoverDirectory = Path(self.TempDir.name)
+        for Name, Color in (("0.jpg", "#ff0000"), ("7.jpg", "#0000ff")):
+            Image = QImage(40, 50, QImage.Format_RGB32)
+            Image.fill(QColor(Color))
+            Image.save(str(CoverDirectory / Name))
+        Patcher = mock.patch.object(ThumbnailLoader, "CoverDirectory", CoverDirectory)
+        Patcher.start()
+        self.addCleanup(Patcher.stop)
+        self.Grid = BookGrid(None)
+
+    def tearDown(self):
+        self.Grid.deleteLater()
+        QApplication.processEvents()
+        self.TempDir.cleanup()
+
+    def CoverColor(self, Card) -> QColor:
+        Image = Card.CoverLabel.pixmap().toImage()
+        return Image.pixelColor(Image.width() // 2, Image.height() // 2)
+
+    def test_CoverFileIsFoundByBookId(self):
+        self.Grid.SetBooks([MakeBook(7, "Seven", None), MakeBook(8, "Eight", None)])
+        Seven, Eight = self.Grid.BookCards
+        self.assertGreater(self.CoverColor(Seven).blue(), 200)  # 7.jpg (JPEG, so not exact)
+        # No 8.jpg: the placeholder, never another book's cover such as 0.jpg
+        Image = Eight.CoverLabel.pixmap().toImage()
+        self.assertEqual(Image.pixelColor(1, 1), QColor("#E0E0E0"))
+
+if __name__ == "__main__":
+    unittest.main()
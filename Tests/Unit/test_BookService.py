@@ -0,0 +1,125 @@
+# File: test_BookService.py
+# Path: Tests/Unit/test_BookService.py
+# Standard: AIDEV-PascalCase-1.8
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  04:00PM
+"""
+Description: Unit Tests for BookService
+Covers the service-level caches against a temporary library database.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from Source.Core.BookService import BookService
+from Source.Core.DatabaseManager import DatabaseManager
+from Source.Data.DatabaseModels import SearchCriteria
+from Tests.Unit.LibraryFixture import BOOKS, CreateLibraryDatabase, TitlesInOrder
+
+
+class BookServiceTestCase(unittest.TestCase):
+    """Base case: a fresh library database, manager and service per test."""
+
+    def setUp(self):
+        self.TempDir = tempfile.TemporaryDirectory()
+        self.DatabasePath = CreateLibraryDatabase(Path(self.TempDir.name) / "Library.db")
+        self.Manager = DatabaseManager(str(self.DatabasePath))
+        self.Service = BookService(self.Manager)
+
+    def tearDown(self):
+        self.Manager.Close()
+        self.TempDir.cleanup()
+
+    def Titles(self, Books):
+        return [Book['Title'] for Book in Books]
+
+
+class TestAllBooks(BookServiceTestCase):
+    """GetAllBooks pages before and after the full list is loaded."""
+
+    def test_PageBeforeFullListIsLoaded(self):
+        Page = self.Service.GetAllBooks(Limit=3, Offset=3)
+        self.assertIsNone(self.Service._AllBooksCache)
+        self.assertEqual(self.Titles(Page), TitlesInOrder(Id for Id, *_ in BOOKS)[3:6])
+
+    def test_PagesComeFromLoadedList(self):
+        Full = self.Service.GetAllBooks()
+        self.assertEqual(len(Full), len(BOOKS))
+        self.assertEqual(self.Service.GetAllBooks(Limit=4, Offset=8), Full[8:12])
+
+
+class TestOpenedBooks(BookServiceTestCase):
+    """MarkOpened queues the timestamp; FlushLastOpened writes it."""
+
+    def test_MarkOpenedUpdatesCachedBookAndQueues(self):
+        Book = next(Book for Book in self.Service.GetAllBooks() if Book['id'] == 3)
+
+        self.Service.MarkOpened(Book)
+        self.assertIsNotNone(self.Service._BooksById[3]['LastOpened'])
+        self.assertIsNone(self.Manager.GetBookById(3)['LastOpened'])
+
+        self.assertEqual(self.Service.FlushLastOpened(), 1)
+        self.assertIsNotNone(self.Manager.GetBookById(3)['LastOpened'])
+        self.assertEqual(self.Service.FlushLastOpened(), 0)
+
+
+class TestTitlePrefix(BookServiceTestCase):
+    """SearchBooksPrefix serves type-ahead completion."""
+
+    def test_PrefixSearch(self):
+        self.assertEqual(self.Titles(self.Service.SearchBooksPrefix("C")), TitlesInOrder([4, 5]))
+        self.assertEqual(len(self.Service.SearchBooksPrefix("C", Limit=1)), 1)
+
+
+class TestCategoriesAndSubjects(BookServiceTestCase):
+    """Category and subject names come from one warmed pair query."""
+
+    def test_NamesAreSortedWithoutDuplicates(self):
+        self.assertEqual(self.Service.GetCategories(), ["Empty Category", "Programming", "Science"])
+        self.assertEqual(self.Service.GetSubjects(), ["Biology", "C Languages", "Physics", "Python"])
+
+    def test_SubjectsPerCategory(self):
+        self.assertEqual(self.Service.GetSubjectsForCategory("Programming"), ["C Languages", "Python"])
+        self.assertEqual(self.Service.GetSubjectsForCategory("Empty Category"), [])
+        self.assertEqual(self.Service.GetSubjects("All Categories"), self.Service.GetSubjects())
+
+
+class TestSearchByCriteria(BookServiceTestCase):
+    """SearchByCriteria results are cached by criteria signature."""
+
+    def test_FiltersAndSorts(self):
+        Criteria = SearchCriteria(Categories=["Programming"], SortBy="Authors")
+        Books = self.Service.SearchByCriteria(Criteria)
+        self.assertEqual([Book['id'] for Book in Books], [7, 4, 1, 3, 2])  # NULL author first
+
+    def test_EqualCriteriaShareOneCacheEntry(self):
+        First = self.Service.SearchByCriteria(SearchCriteria(SearchTerm="python"))
+        Second = self.Service.SearchByCriteria(SearchCriteria(SearchTerm=" python "))
+        self.assertEqual(First, Second)
+        self.assertEqual(len(self.Service._SearchCache), 1)
+
+    def test_CallersGetIndependentLists(self):
+        Criteria = SearchCriteria(Subjects=["Python"])
+        self.Service.SearchByCriteria(Criteria).clear()
+        self.assertEqual(len(self.Service.SearchByCriteria(Criteria)), 2)
+
+    def test_CacheIsBounded(self):
+        self.Service.SearchCacheSize = 2
+        for Rating in range(4):
+            self.Service.SearchByCriteria(SearchCriteria(MinRating=Rating))
+        self.assertEqual(len(self.Service._SearchCache), 2)
+
+    def test_ClearCacheDropsResults(self):
+        self.Service.SearchByCriteria(SearchCriteria(MinRating=4))
+        self.Service.ClearCache()
+        self.assertEqual(len(self.Service._SearchCache), 0)
+
+    def test_MarkOpenedDropsResults(self):
+        Books = self.Service.SearchByCriteria(SearchCriteria(Subjects=["C Languages"]))
+        self.Service.MarkOpened(Books[0])
+        self.assertEqual(len(self.Service._SearchCache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
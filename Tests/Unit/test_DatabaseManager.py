@@ -0,0 +1,323 @@
+# File: test_DatabaseManager.py
+# Path: Tests/Unit/test_DatabaseManager.py
+# Standard: AIDEV-PascalCase-1.8
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  04:00PM
+"""
+Description: Unit Tests for DatabaseManager
+Runs the query layer against a temporary copy of the library schema.
+"""
+
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from Source.Core.DatabaseManager import DatabaseManager
+from Source.Data.DatabaseModels import SearchCriteria
+from Tests.Unit.LibraryFixture import BOOKS, CreateLibraryDatabase, TitlesInOrder
+
+
+class DatabaseManagerTestCase(unittest.TestCase):
+    """Base case: a fresh library database and manager per test."""
+
+    def setUp(self):
+        self.TempDir = tempfile.TemporaryDirectory()
+        self.DatabasePath = CreateLibraryDatabase(Path(self.TempDir.name) / "Library.db")
+        self.Manager = DatabaseManager(str(self.DatabasePath))
+
+    def tearDown(self):
+        self.Manager.Close()
+        self.TempDir.cleanup()
+
+    def Titles(self, Books):
+        return [Book['Title'] for Book in Books]
+
+
+class _RecordingConnection:
+    """Stands in for a connection, recording pragmas and refusing journal_mode."""
+
+    def __init__(self):
+        self.Executed = []
+
+    def execute(self, Sql):
+        if "journal_mode" in Sql:
+            raise sqlite3.OperationalError("attempt to write a readonly database")
+        self.Executed.append(Sql)
+
+
+class TestConnectionPragmas(DatabaseManagerTestCase):
+    """Connection tuning survives a pragma the database refuses."""
+
+    def test_RefusedJournalModeDoesNotSkipOtherPragmas(self):
+        Connection = _RecordingConnection()
+        with self.assertLogs("DatabaseManager", level="WARNING"):
+            self.Manager.ApplyPragmas(Connection, ReadOnly=False)
+        self.assertIn("PRAGMA synchronous=NORMAL", Connection.Executed)
+        self.assertIn("PRAGMA cache_size=-65536", Connection.Executed)
+
+    def test_ReadersLeaveJournalModeToWriter(self):
+        Statements = []
+        Reader = self.Manager.GetConnection()
+        Reader.set_trace_callback(Statements.append)
+        self.Manager.ApplyPragmas(Reader)
+        self.assertFalse([Sql for Sql in Statements if "journal_mode" in Sql])
+        self.assertIn("PRAGMA cache_size=-65536", Statements)
+
+    def test_ReaderOpensOnDatabaseNotInWal(self):
+        self.Manager.Connection.execute("PRAGMA journal_mode=DELETE")
+        Reader = self.Manager._OpenConnection()
+        try:
+            self.assertEqual(Reader.execute("SELECT COUNT(*) FROM books").fetchone(), (9,))
+            self.assertEqual(Reader.execute("PRAGMA cache_size").fetchone(), (-65536,))
+        finally:
+            Reader.close()
+
+
+class TestGetBooks(DatabaseManagerTestCase):
+    """GetBooks filters, paging, title prefixes and id lookups."""
+
+    def test_FiltersKeepBooksWithoutSubject(self):
+        Books = self.Manager.GetBooks(Category="Programming")
+        self.assertEqual(self.Titles(Books), TitlesInOrder([1, 2, 3, 4, 7]))
+        self.assertEqual(Books[self.Titles(Books).index("Untitled Programming Notes")]['Subject'], 'General')
+
+    def test_PagesConcatenateToFullList(self):
+        Full = self.Titles(self.Manager.GetBooks())
+        Paged = []
+        for Offset in range(0, len(BOOKS), 2):
+            Paged += self.Titles(self.Manager.GetBooks(Limit=2, Offset=Offset))
+        self.assertEqual(Paged, Full)
+
+    def test_TitlePrefixIsCaseSensitive(self):
+        self.assertEqual(self.Titles(self.Manager.GetBooks(TitlePrefix="Py")), ["Python Crash Course"])
+        self.assertEqual(self.Manager.GetBooks(TitlePrefix="py"), [])
+
+    def test_TitlePrefixMatchesGlobCharactersLiterally(self):
+        self.assertEqual(self.Titles(self.Manager.GetBooks(TitlePrefix="C*")), ["C* Notes"])
+        self.assertEqual(self.Titles(self.Manager.GetBooks(TitlePrefix="C", Limit=1)), ["C* Notes"])
+
+    def test_BooksByIdsComeBackInTitleOrder(self):
+        Books = self.Manager.GetBooksByIds([6, 1, 42, 6])
+        self.assertEqual(self.Titles(Books), TitlesInOrder([1, 6]))
+
+    def test_BooksByIdsSpanSeveralBatches(self):
+        with mock.patch("Source.Core.DatabaseManager._ID_BATCH_SIZE", 2):
+            Books = self.Manager.GetBooksByIds([Id for Id, *_ in BOOKS])
+        self.assertEqual(Books, self.Manager.GetBooks())
+
+
+class TestCategorySubjectIndex(DatabaseManagerTestCase):
+    """GetCategorySubjectIndex and the category/subject name pairs."""
+
+    def test_BooksWithoutSubjectOrCategoryAreKeyedUnderEmptyName(self):
+        Index = self.Manager.GetCategorySubjectIndex()
+        self.assertEqual(Index["Programming"][""], [7])
+        self.assertEqual(Index["Science"][""], [8])  # Dangling subject id
+        self.assertEqual(Index[""][""], [9])
+
+    def test_IndexCoversEveryBookOnceInTitleOrder(self):
+        Index = self.Manager.GetCategorySubjectIndex()
+        Ids = [Id for Subjects in Index.values() for Ids in Subjects.values() for Id in Ids]
+        self.assertCountEqual(Ids, [Id for Id, *_ in BOOKS])
+        self.assertEqual(Index["Programming"]["Python"], [2, 1])  # Fluent before Python
+
+    def test_IndexMatchesFilterQueries(self):
+        Index = self.Manager.GetCategorySubjectIndex()
+        for Category, Subjects in Index.items():
+            if not Category:
+                continue
+            for Subject, Ids in Subjects.items():
+                if not Subject:
+                    continue
+                with self.subTest(Category=Category, Subject=Subject):
+                    Books = self.Manager.GetBooks(Category=Category, Subject=Subject)
+                    self.assertEqual([Book['id'] for Book in Books], Ids)
+
+    def test_CategorySubjectPairsAreDistinct(self):
+        Pairs = self.Manager.GetCategorySubjectPairs()
+        self.assertEqual(len(Pairs), len(set(Pairs)))
+        self.assertIn(("Empty Category", None), [tuple(Pair) for Pair in Pairs])
+
+
+class TestLastOpened(DatabaseManagerTestCase):
+    """Last-opened timestamps are queued and written in one batch."""
+
+    _LAST_OPENED_QUERY = "SELECT id, last_opened FROM books WHERE last_opened IS NOT NULL ORDER BY id"
+
+    def test_QueueDefersWriteUntilFlush(self):
+        Timestamp = self.Manager.QueueLastOpened(2)
+        self.Manager.QueueLastOpened(5)
+        self.assertEqual(self.Manager.ExecuteQuery(self._LAST_OPENED_QUERY), [])
+
+        self.assertEqual(self.Manager.FlushLastOpened(), 2)
+        Rows = self.Manager.ExecuteQuery(self._LAST_OPENED_QUERY)
+        self.assertEqual([Row[0] for Row in Rows], [2, 5])
+        self.assertEqual(Rows[0][1], Timestamp)
+
+    def test_FlushEmptiesQueue(self):
+        self.Manager.QueueLastOpened(1)
+        self.Manager.QueueLastOpened(1)  # Reopening keeps one entry
+        self.assertEqual(self.Manager.FlushLastOpened(), 1)
+        self.assertEqual(self.Manager.FlushLastOpened(), 0)
+
+    def test_CloseFlushesQueue(self):
+        self.Manager.QueueLastOpened(4)
+        self.Manager.Close()
+        self.Manager.Connect()
+        self.assertEqual([Row[0] for Row in self.Manager.ExecuteQuery(self._LAST_OPENED_QUERY)], [4])
+
+
+class TestConnections(DatabaseManagerTestCase):
+    """Per-thread read-only connections."""
+
+    def test_ReadersAreSeparateFromWriter(self):
+        self.assertIsNot(self.Manager.GetConnection(), self.Manager.Connection)
+
+    def test_EachThreadGetsItsOwnReader(self):
+        Connections = []
+        Worker = threading.Thread(target=lambda: Connections.append(self.Manager.GetConnection()))
+        Worker.start()
+        Worker.join()
+        self.assertIsNot(Connections[0], self.Manager.GetConnection())
+
+    def test_ClosedManagerHasNoConnection(self):
+        self.Manager.Close()
+        self.assertIsNone(self.Manager.GetConnection())
+        with self.assertLogs("DatabaseManager", level="ERROR"):
+            self.assertEqual(self.Manager.ExecuteQuery("SELECT 1"), [])
+
+
+class TestResultCache(DatabaseManagerTestCase):
+    """SELECT results are cached until the next write."""
+
+    _NOTES_QUERY = "SELECT Notes FROM books WHERE id = ?"
+
+    def test_RepeatedSelectIsServedFromCache(self):
+        self.Manager.ExecuteQuery(self._NOTES_QUERY, (1,))
+        self.assertIn((self._NOTES_QUERY, (1,)), self.Manager._ResultCache)
+
+    def test_WriteInvalidatesCache(self):
+        self.assertEqual(self.Manager.ExecuteQuery(self._NOTES_QUERY, (1,)), [(None,)])
+        self.Manager.ExecuteQuery("UPDATE books SET Notes = 'read' WHERE id = 1")
+        self.assertEqual(self.Manager.ExecuteQuery(self._NOTES_QUERY, (1,)), [('read',)])
+
+    def test_BatchWriteInvalidatesCache(self):
+        self.Manager.ExecuteQuery(self._NOTES_QUERY, (2,))
+        self.Manager.ExecuteMany("UPDATE books SET Notes = ? WHERE id = ?", [("a", 1), ("b", 2)])
+        self.assertEqual(self.Manager.ExecuteQuery(self._NOTES_QUERY, (2,)), [('b',)])
+
+    def test_ResultReadBeforeWriteIsNotCached(self):
+        Key = (self._NOTES_QUERY, (3,))
+        Generation = self.Manager._WriteGeneration
+        StaleRows = self.Manager.GetConnection().execute(*Key).fetchall()
+        self.Manager.ExecuteQuery("UPDATE books SET Notes = 'new' WHERE id = 3")
+
+        self.Manager._CacheResult(Key, StaleRows, Generation)
+        self.assertNotIn(Key, self.Manager._ResultCache)
+        self.assertEqual(self.Manager.ExecuteQuery(*Key), [('new',)])
+
+    def test_CacheIsBoundedByBlobBytes(self):
+        self.Manager.ResultCacheBytes = 200  # Room for three 64-byte thumbnails
+        self.Manager.GetBooks(Category="Science")  # Three books
+        self.assertEqual(len(self.Manager._ResultCache), 1)
+        self.Manager.GetBooks(Category="Programming")  # Five books: too large to keep
+        self.assertEqual(len(self.Manager._ResultCache), 1)
+        self.Manager.GetBooks(Subject="Python")  # Two books: evicts the Science result
+        self.assertEqual(len(self.Manager._ResultCache), 1)
+        self.assertLessEqual(self.Manager._ResultCacheByteCount, self.Manager.ResultCacheBytes)
+
+
+class TestSearchTerm(DatabaseManagerTestCase):
+    """Search terms use the trigram index when available and LIKE otherwise."""
+
+    def test_FullTextIndexIsBuilt(self):
+        self.assertTrue(self.Manager._HasSearchIndex)
+
+    def test_IndexAndLikeAgree(self):
+        for Term in ("python", "PYTHON", "feyn", "Notes", "C", "zz", 'say "hi"'):
+            with self.subTest(Term=Term):
+                Indexed = self.Titles(self.Manager.GetBooks(SearchTerm=Term))
+                self.Manager._HasSearchIndex = False
+                try:
+                    Like = self.Titles(self.Manager.GetBooks(SearchTerm=Term))
+                finally:
+                    self.Manager._HasSearchIndex = True
+                self.assertEqual(Indexed, Like)
+
+    def test_MatchesTitleOrAuthor(self):
+        self.assertEqual(self.Titles(self.Manager.GetBooks(SearchTerm="python")), TitlesInOrder([1, 2]))
+        self.assertEqual(self.Titles(self.Manager.GetBooks(SearchTerm="ramalho")), TitlesInOrder([2]))
+
+    def test_IndexFollowsWrites(self):
+        self.Manager.ExecuteQuery("UPDATE books SET title = 'Python Cookbook' WHERE id = 5")
+        self.assertIn("Python Cookbook", self.Titles(self.Manager.GetBooks(SearchTerm="cookbook")))
+
+
+class TestStreamedBooks(DatabaseManagerTestCase):
+    """The unfiltered book list is streamed through _IterQuery."""
+
+    def test_StreamedFullListMatchesQueriedList(self):
+        Streamed = self.Manager.GetBooks()
+        Queried = self.Manager.GetBooksByIds([Id for Id, *_ in BOOKS])
+        self.assertEqual(Streamed, Queried)
+
+    def test_ErrorPartWayThroughIsNotATruncatedList(self):
+        Reader = self.Manager.GetConnection()
+
+        def FailAfterFirstRow(Query, Parameters=()):
+            Rows = Reader.execute(Query, Parameters)
+            yield next(Rows)
+            raise sqlite3.OperationalError("disk I/O error")
+
+        FailingReader = SimpleNamespace(execute=FailAfterFirstRow)
+        with mock.patch.object(self.Manager, "GetConnection", return_value=FailingReader):
+            with self.assertLogs("DatabaseManager", level="ERROR"):
+                self.assertEqual(self.Manager.GetBooks(), [])
+
+class TestSearchBooks(DatabaseManagerTestCase):
+    """SearchBooks(SearchCriteria): list filters, rating bounds, sorting, paging."""
+
+    def test_FiltersByEveryListedValue(self):
+        Books = self.Manager.SearchBooks(SearchCriteria(Categories=["Science"]))
+        self.assertEqual(self.Titles(Books), TitlesInOrder([5, 6, 8]))
+
+        Books = self.Manager.SearchBooks(SearchCriteria(Subjects=["Python", "Biology"]))
+        self.assertEqual(self.Titles(Books), TitlesInOrder([1, 2, 5]))
+
+        Books = self.Manager.SearchBooks(SearchCriteria(Authors=["Alberts", "Nobody"]))
+        self.assertEqual(self.Titles(Books), TitlesInOrder([5, 9]))
+
+    def test_CombinesFilters(self):
+        Criteria = SearchCriteria(Categories=["Programming"], MinRating=5)
+        self.assertEqual(self.Titles(self.Manager.SearchBooks(Criteria)), TitlesInOrder([1, 3]))
+
+    def test_UnratedBooksCompareAsZero(self):
+        Books = self.Manager.SearchBooks(SearchCriteria(MaxRating=0))
+        self.assertEqual(self.Titles(Books), TitlesInOrder([4, 9]))
+
+    def test_SortsByWhitelistedColumn(self):
+        Books = self.Manager.SearchBooks(SearchCriteria(SortBy="Rating", SortOrder="DESC"))
+        Ratings = [Book['Rating'] for Book in Books]
+        self.assertEqual(Ratings, sorted(Ratings, reverse=True))
+        # Ties are broken by title
+        self.assertEqual(self.Titles(Books[:3]), TitlesInOrder([1, 3, 6]))
+
+    def test_UnknownSortColumnFallsBackToTitle(self):
+        Criteria = SearchCriteria(SortBy="title; DROP TABLE books; --")
+        Books = self.Manager.SearchBooks(Criteria)
+        self.assertEqual(self.Titles(Books), TitlesInOrder(Id for Id, *_ in BOOKS))
+        self.assertEqual(len(self.Manager.GetBooks()), len(BOOKS))
+
+    def test_PagesWithLimitAndOffset(self):
+        Pages = [self.Manager.SearchBooks(SearchCriteria(Limit=4, Offset=Offset)) for Offset in (0, 4, 8)]
+        self.assertEqual([len(Page) for Page in Pages], [4, 4, 1])
+        self.assertEqual(sum((self.Titles(Page) for Page in Pages), []),
+                         TitlesInOrder(Id for Id, *_ in BOOKS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+# File: test_MainWindow.py
+# Path: Tests/Unit/test_MainWindow.py
+# Standard: AIDEV-PascalCase-1.8
+# Created: 2026-10-17
+# Last Modified: 2026-10-17  03:58PM
+"""
+Description: Unit Tests for MainWindow
+Checks the category/subject filter index lookup against the database filter
+queries it stands in for, without building the window itself.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from Source.Core.BookService import BookService
+from Source.Core.DatabaseManager import DatabaseManager
+from Source.Interface.MainWindow import MainWindow
+from Tests.Unit.LibraryFixture import CreateLibraryDatabase
+
+
+class TestFilterIndexLookup(unittest.TestCase):
+    """Category/subject filters resolved through the in-memory id index."""
+
+    def setUp(self):
+        self.TempDir = tempfile.TemporaryDirectory()
+        self.DatabasePath = CreateLibraryDatabase(Path(self.TempDir.name) / "Library.db")
+        self.Manager = DatabaseManager(str(self.DatabasePath))
+        self.Service = BookService(self.Manager)
+        self.Window = SimpleNamespace(_FilterIndex=self.Manager.GetCategorySubjectIndex())
+
+    def tearDown(self):
+        self.Manager.Close()
+        self.TempDir.cleanup()
+
+    def Lookup(self, Category, Subject):
+        return MainWindow._LookupFilterIndex(self.Window, Category, Subject)
+
+    def test_NotReadyUntilIndexIsBuilt(self):
+        self.Window._FilterIndex = None
+        self.assertIsNone(self.Lookup("Programming", ""))
+
+    def test_UnknownNamesMatchNothing(self):
+        self.assertEqual(self.Lookup("Unknown", ""), [])
+        self.assertEqual(self.Lookup("Programming", "Biology"), [])
+
+    def test_LookupsMatchDatabaseFilters(self):
+        Categories = ["", "Programming", "Science", "Empty Category", "Unknown"]
+        Subjects = ["", "Python", "C Languages", "Biology", "Physics", "Unknown"]
+        for Category in Categories:
+            for Subject in Subjects:
+                if not Category and not Subject:
+                    continue
+                with self.subTest(Category=Category, Subject=Subject):
+                    Expected = self.Service.GetBooksByFilters(Category, Subject)
+                    BookIds = self.Lookup(Category, Subject)
+                    Books = self.Service.GetBooksByIds(BookIds) if BookIds else []
+                    self.assertEqual(Books, Expected)
+
+    def test_BooksWithoutSubjectAreIncluded(self):
+        self.assertIn(7, self.Lookup("Programming", ""))  # No subject
+        self.assertIn(8, self.Lookup("Science", ""))  # Subject id points nowhere
+
+
+if __name__ == "__main__":
+    unittest.main()